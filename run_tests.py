@@ -4,5 +4,12 @@ import pytest
 
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent / "src"))
 
+# Boucle locale rapide : relance d'abord les échecs et s'arrête au premier,
+# en série et sans couverture (--stepwise ne fonctionne pas sous xdist).
+DEV_ARGS = ["--failed-first", "--stepwise", "-n0", "--no-cov"]
+
 if __name__ == "__main__":
-    pytest.main(["-v", "--color=yes", "--maxfail=3"])
+    args = sys.argv[1:]
+    if "--dev" in args:
+        args = [arg for arg in args if arg != "--dev"] + DEV_ARGS
+    sys.exit(pytest.main(["-v", "--color=yes", "--maxfail=3", *args]))
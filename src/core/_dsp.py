@@ -0,0 +1,46 @@
+"""
+Noyaux DSP compilés (Numba) pour le traitement audio hors scipy/librosa.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _output_length(n_samples: int, ratio: float) -> int:
+    """Nombre d'échantillons produits pour un facteur de vitesse ``ratio``."""
+    return max(1, int(round(n_samples / ratio))) if n_samples else 0
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _resample_linear_kernel(x, ratio, n_out):
+        out = np.empty(n_out, dtype=np.float32)
+        last = x.shape[0] - 1
+        for i in prange(n_out):
+            pos = i * ratio
+            left = int(pos)
+            if left >= last:
+                out[i] = x[last]
+            else:
+                frac = pos - left
+                out[i] = x[left] * (1.0 - frac) + x[left + 1] * frac
+        return out
+
+    def resample_linear(x: np.ndarray, ratio: float) -> np.ndarray:
+        """Rééchantillonnage linéaire : ``ratio`` > 1 accélère (sortie plus courte)."""
+        n_out = _output_length(len(x), ratio)
+        if n_out == 0:
+            return np.empty(0, dtype=np.float32)
+        return _resample_linear_kernel(np.ascontiguousarray(x, dtype=np.float32), float(ratio), n_out)
+else:
+    def resample_linear(x: np.ndarray, ratio: float) -> np.ndarray:
+        """Rééchantillonnage linéaire : ``ratio`` > 1 accélère (sortie plus courte)."""
+        n_out = _output_length(len(x), ratio)
+        if n_out == 0:
+            return np.empty(0, dtype=np.float32)
+        positions = np.arange(n_out, dtype=np.float64) * ratio
+        return np.interp(positions, np.arange(len(x)), x).astype(np.float32)
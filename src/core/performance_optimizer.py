@@ -3,22 +3,98 @@ import torch
 import gc
 import threading
 import time
+from enum import IntFlag
 from typing import Dict, List, Optional
+import numpy as np
 from ..utils.logger import logger
 
+# Messages d'alerte pré-formatés (évite de reconstruire les f-strings à chaque cycle)
+_MSG_CPU_HIGH = "CPU élevé: {:.1f}%".format
+_MSG_MEMORY_HIGH = "Mémoire élevée: {:.1f}%".format
+_MSG_GPU_MEMORY_HIGH = "GPU mémoire élevée: {:.1f}%".format
+_MSG_DISK_READ_HIGH = "Disque lecture élevée: {:.1f} MB/s".format
+_MSG_DISK_WRITE_HIGH = "Disque écriture élevée: {:.1f} MB/s".format
+_MSG_NETWORK_HIGH = "Réseau élevé: {:.1f} MB/s".format
+
+
+class AlertFlags(IntFlag):
+    """Alertes de performance actives, combinables par OU binaire."""
+
+    NONE = 0
+    CPU_HIGH = 1
+    MEMORY_HIGH = 2
+    GPU_MEMORY_HIGH = 4
+    DISK_READ_HIGH = 8
+    DISK_WRITE_HIGH = 16
+    NETWORK_HIGH = 32
+
+
+# Nombre de points conservés par métrique
+_HISTORY_SIZE = 100
+
+
+class _RingBuffer:
+    """Tampon circulaire float32 de taille fixe pour l'historique d'une métrique."""
+
+    __slots__ = ("buf", "idx", "count")
+
+    def __init__(self, capacity: int = _HISTORY_SIZE):
+        self.buf = np.empty(capacity, dtype=np.float32)
+        self.idx = 0
+        self.count = 0
+
+    def push(self, value: float):
+        """Ajoute une valeur en écrasant la plus ancienne si le tampon est plein."""
+        self.buf[self.idx] = value
+        self.idx = (self.idx + 1) % self.buf.size
+        if self.count < self.buf.size:
+            self.count += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def values(self) -> np.ndarray:
+        """Retourne toutes les valeurs dans l'ordre chronologique."""
+        if self.count < self.buf.size:
+            return self.buf[:self.count]
+        return np.roll(self.buf, -self.idx)
+
+    def last(self, n: int) -> np.ndarray:
+        """Retourne les ``n`` dernières valeurs (vue sans copie si contiguës)."""
+        n = min(n, self.count)
+        start = self.idx - n
+        if start >= 0:
+            return self.buf[start:self.idx]
+        return np.concatenate((self.buf[start:], self.buf[:self.idx]))
+
+
 class PerformanceOptimizer:
     """Optimiseur de performance avancé pour l'assistant vocal."""
     
+    __slots__ = (
+        "is_monitoring",
+        "monitoring_thread",
+        "performance_stats",
+        "alert_thresholds",
+        "model_cache",
+        "last_optimization",
+        "optimization_cooldown",
+    )
+    
     def __init__(self):
         self.is_monitoring = False
         self.monitoring_thread = None
         self.performance_stats = {
-            "cpu_usage": [],
-            "memory_usage": [],
-            "gpu_memory": [],
-            "disk_io": [],
-            "network_io": [],
-            "response_times": []
+            key: _RingBuffer()
+            for key in (
+                "cpu_percent",
+                "memory_percent",
+                "gpu_memory",
+                "disk_read_mbps",
+                "disk_write_mbps",
+                "network_mbps",
+                "response_times",
+            )
         }
         self.alert_thresholds = {
             "cpu_max": 80.0,
@@ -151,54 +227,71 @@ class PerformanceOptimizer:
         if not stats:
             return
         
-        # Ajouter aux listes (limiter à 100 points)
-        for key in ["cpu_percent", "memory_percent", "disk_read_mbps", "disk_write_mbps", "network_mbps"]:
+        # Ajouter aux tampons circulaires (limités à _HISTORY_SIZE points)
+        for key in ("cpu_percent", "memory_percent", "disk_read_mbps", "disk_write_mbps", "network_mbps"):
             if key in stats:
-                self.performance_stats[key].append(stats[key])
-                if len(self.performance_stats[key]) > 100:
-                    self.performance_stats[key] = self.performance_stats[key][-100:]
+                self.performance_stats[key].push(stats[key])
         
         # GPU memory
         if "gpu_memory_used_mb" in stats:
-            self.performance_stats["gpu_memory"].append(stats["gpu_memory_used_mb"])
-            if len(self.performance_stats["gpu_memory"]) > 100:
-                self.performance_stats["gpu_memory"] = self.performance_stats["gpu_memory"][-100:]
+            self.performance_stats["gpu_memory"].push(stats["gpu_memory_used_mb"])
     
-    def _check_alerts(self, stats: Dict) -> List[str]:
-        """Vérifie les alertes de performance avancées."""
-        alerts = []
+    def _check_alert_flags(self, stats: Dict) -> AlertFlags:
+        """Retourne les alertes de performance actives sous forme de drapeaux."""
+        flags = AlertFlags.NONE
         
         if not stats:
-            return alerts
+            return flags
+        
+        thresholds = self.alert_thresholds
         
         # CPU
-        cpu_percent = stats.get("cpu_percent", 0)
-        if cpu_percent > self.alert_thresholds["cpu_max"]:
-            alerts.append(f"CPU élevé: {cpu_percent:.1f}%")
+        if stats.get("cpu_percent", 0) > thresholds["cpu_max"]:
+            flags |= AlertFlags.CPU_HIGH
         
         # Mémoire
-        memory_percent = stats.get("memory_percent", 0)
-        if memory_percent > self.alert_thresholds["memory_max"]:
-            alerts.append(f"Mémoire élevée: {memory_percent:.1f}%")
+        if stats.get("memory_percent", 0) > thresholds["memory_max"]:
+            flags |= AlertFlags.MEMORY_HIGH
         
         # GPU
         if "gpu_memory_used_mb" in stats and "gpu_memory_total_mb" in stats:
             gpu_percent = (stats["gpu_memory_used_mb"] / stats["gpu_memory_total_mb"]) * 100
-            if gpu_percent > self.alert_thresholds["gpu_memory_max"]:
-                alerts.append(f"GPU mémoire élevée: {gpu_percent:.1f}%")
+            if gpu_percent > thresholds["gpu_memory_max"]:
+                flags |= AlertFlags.GPU_MEMORY_HIGH
         
         # Disque I/O
-        if "disk_read_mbps" in stats:
-            if stats["disk_read_mbps"] > self.alert_thresholds["disk_io_max"]:
-                alerts.append(f"Disque lecture élevée: {stats['disk_read_mbps']:.1f} MB/s")
-        if "disk_write_mbps" in stats:
-            if stats["disk_write_mbps"] > self.alert_thresholds["disk_io_max"]:
-                alerts.append(f"Disque écriture élevée: {stats['disk_write_mbps']:.1f} MB/s")
+        if stats.get("disk_read_mbps", 0) > thresholds["disk_io_max"]:
+            flags |= AlertFlags.DISK_READ_HIGH
+        if stats.get("disk_write_mbps", 0) > thresholds["disk_io_max"]:
+            flags |= AlertFlags.DISK_WRITE_HIGH
         
         # Réseau I/O
-        if "network_mbps" in stats:
-            if stats["network_mbps"] > self.alert_thresholds["network_io_max"]:
-                alerts.append(f"Réseau élevé: {stats['network_mbps']:.1f} MB/s")
+        if stats.get("network_mbps", 0) > thresholds["network_io_max"]:
+            flags |= AlertFlags.NETWORK_HIGH
+        
+        return flags
+    
+    def _check_alerts(self, stats: Dict) -> List[str]:
+        """Vérifie les alertes de performance avancées."""
+        alerts = []
+        flags = self._check_alert_flags(stats)
+        
+        if not flags:
+            return alerts
+        
+        if flags & AlertFlags.CPU_HIGH:
+            alerts.append(_MSG_CPU_HIGH(stats["cpu_percent"]))
+        if flags & AlertFlags.MEMORY_HIGH:
+            alerts.append(_MSG_MEMORY_HIGH(stats["memory_percent"]))
+        if flags & AlertFlags.GPU_MEMORY_HIGH:
+            gpu_percent = (stats["gpu_memory_used_mb"] / stats["gpu_memory_total_mb"]) * 100
+            alerts.append(_MSG_GPU_MEMORY_HIGH(gpu_percent))
+        if flags & AlertFlags.DISK_READ_HIGH:
+            alerts.append(_MSG_DISK_READ_HIGH(stats["disk_read_mbps"]))
+        if flags & AlertFlags.DISK_WRITE_HIGH:
+            alerts.append(_MSG_DISK_WRITE_HIGH(stats["disk_write_mbps"]))
+        if flags & AlertFlags.NETWORK_HIGH:
+            alerts.append(_MSG_NETWORK_HIGH(stats["network_mbps"]))
         
         return alerts
     
@@ -304,14 +397,15 @@ class PerformanceOptimizer:
         try:
             # Statistiques récentes
             recent_stats = {}
-            for key, values in self.performance_stats.items():
-                if values:
+            for key, history in self.performance_stats.items():
+                if history:
+                    values = history.values()
                     recent_stats[key] = {
-                        "current": values[-1] if values else 0,
-                        "average": sum(values) / len(values) if values else 0,
-                        "max": max(values) if values else 0,
-                        "min": min(values) if values else 0,
-                        "trend": self._calculate_trend(values) if len(values) > 1 else "stable"
+                        "current": float(values[-1]),
+                        "average": float(values.mean()),
+                        "max": float(values.max()),
+                        "min": float(values.min()),
+                        "trend": self._calculate_trend(history) if len(history) > 1 else "stable"
                     }
             
             # Utilisation système actuelle
@@ -333,14 +427,19 @@ class PerformanceOptimizer:
             logger.error(f"Erreur rapport performance: {e}")
             return {"error": str(e)}
     
-    def _calculate_trend(self, values: List[float]) -> str:
-        """Calcule la tendance d'une série de valeurs."""
-        if len(values) < 2:
+    def _calculate_trend(self, values) -> str:
+        """Calcule la tendance d'une série de valeurs (liste ou _RingBuffer)."""
+        if isinstance(values, _RingBuffer):
+            window = values.last(10)
+        else:
+            window = np.asarray(values[-10:], dtype=np.float32)
+        count = len(window)
+        if count < 2:
             return "stable"
         
         # Comparer les dernières valeurs avec les précédentes
-        recent_avg = sum(values[-5:]) / min(5, len(values))
-        previous_avg = sum(values[-10:-5]) / min(5, max(1, len(values) - 5))
+        recent_avg = float(window[-5:].sum()) / min(5, count)
+        previous_avg = float(window[-10:-5].sum()) / min(5, max(1, count - 5))
         
         if recent_avg > previous_avg * 1.1:
             return "increasing"
@@ -529,8 +628,7 @@ class PerformanceOptimizer:
     def _should_auto_optimize(self, stats: Dict) -> bool:
         """Vérifie si une auto-optimisation est nécessaire."""
         # Optimiser si plusieurs ressources sont surchargées
-        alert_count = len(self._check_alerts(stats))
-        return alert_count >= 2
+        return int(self._check_alert_flags(stats)).bit_count() >= 2
     
     def _trigger_auto_optimization(self):
         """Déclenche une optimisation automatique."""
@@ -3,14 +3,45 @@ import wave
 import subprocess
 import os
 import tempfile
-import uuid
 import torch
 import time
 import re
-from typing import Optional, Dict, Any
+import json
+import asyncio
+import functools
+import math
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Optional, Dict, Any, BinaryIO, Iterator, List, Tuple, Union
 from ..config import config
 from ..utils.logger import logger
 
+# Clé du cache audio : (texte, vitesse, voix)
+CacheKey = Tuple[str, float, str]
+
+# Délai max de la CLI Piper par texte, et plafond pour un lot complet
+_CLI_TIMEOUT = 30
+_CLI_BATCH_TIMEOUT_MAX = 120
+
+# Durée des blocs produits par synthesize_stream
+_STREAM_CHUNK_SECONDS = 0.02
+
+# Échelle PCM 16 bits (puissance de 2 : multiplier par l'inverse est exact)
+_PCM16_SCALE = np.float32(32768.0)
+_PCM16_INV_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _pcm16_to_float(audio_data: np.ndarray) -> np.ndarray:
+    """int16 -> float32 dans [-1, 1) en une seule passe (sans temporaire)."""
+    return np.multiply(audio_data, _PCM16_INV_SCALE, dtype=np.float32)
+
+
+def _float_to_pcm16(audio_float: np.ndarray) -> np.ndarray:
+    """float32 -> int16; ``audio_float`` est mis à l'échelle sur place."""
+    return np.multiply(audio_float, _PCM16_SCALE, out=audio_float).astype(np.int16, copy=False)
+
+
 def nettoyer_markdown(text):
     # Supprime le gras markdown : **mot** et __mot__
     text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)   # bold **
@@ -26,16 +57,16 @@ class TextToSpeech:
     def __init__(self, default_voice: Optional[str] = None):
         self.use_python_lib = True
         self.current_voice: Optional[Dict[str, Any]] = None
-        self.audio_cache: Dict[str, np.ndarray] = {}
+        self.audio_cache: "OrderedDict[CacheKey, np.ndarray]" = OrderedDict()
         self.max_cache_size = 100
 
-        # Tentative d'import de la bibliothèque Piper
-        try:
-            import piper
+        # Détection de la bibliothèque Piper (mémoïsée au niveau de la classe)
+        piper = self._probe_piper()
+        if piper is not None:
             self.PiperVoice = piper.PiperVoice
             self.piper_module = piper
             logger.info("[OK] Bibliothèque Piper Python disponible")
-        except ImportError:
+        else:
             logger.warning("[ATTENTION] Piper Python library non disponible, fallback sur CLI")
             self.use_python_lib = False
             self.PiperVoice = None
@@ -45,6 +76,16 @@ class TextToSpeech:
         if default_voice:
             self.load_voice(default_voice)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _probe_piper() -> Optional[ModuleType]:
+        """Importe Piper une seule fois par processus; None si indisponible."""
+        try:
+            import piper
+            return piper
+        except ImportError:
+            return None
+
     def load_voice(self, voice_name: str) -> bool:
         """Charge une voix Piper avec vérification."""
         logger.info(f"Tentative de chargement de la voix: {voice_name}")
@@ -102,7 +143,6 @@ class TextToSpeech:
         }
         
         try:
-            import json
             with open(config_path, 'r', encoding='utf-8') as f:
                 config_data = json.load(f)
                 if 'audio' in config_data and 'sample_rate' in config_data['audio']:
@@ -114,7 +154,22 @@ class TextToSpeech:
                    voice_name, self.current_voice["sample_rate"])
         return True
 
-    def synthesize(self, text: str, speed: float = 1.0, cache_key: Optional[str] = None) -> Optional[np.ndarray]:
+    def _cache_key(self, text: str, speed: float) -> CacheKey:
+        """Clé de cache audio : le tuple (texte, vitesse, voix courante) lui-même, sans collision."""
+        voice_name = self.current_voice.get("voice_name", "") if self.current_voice else ""
+        return (text, float(speed), voice_name)
+
+    def _cache_put(self, cache_key: CacheKey, audio_data: np.ndarray):
+        """Ajoute une entrée au cache en évinçant la moins récemment utilisée.
+
+        Le tableau est rendu non modifiable : il est partagé avec tous les appelants.
+        """
+        audio_data.flags.writeable = False
+        self.audio_cache[cache_key] = audio_data
+        if len(self.audio_cache) > self.max_cache_size:
+            self.audio_cache.popitem(last=False)
+
+    def synthesize(self, text: str, speed: float = 1.0, cache_key: Optional[CacheKey] = None) -> Optional[np.ndarray]:
         """Synthétise un texte en audio avec cache."""
         logger.info(f"Synthétisation du texte: {text}")
         text = nettoyer_markdown(text)
@@ -134,9 +189,13 @@ class TextToSpeech:
             logger.warning("Texte vide fourni à la synthèse")
             return None
 
-        if cache_key and cache_key in self.audio_cache:
-            logger.debug("[CACHE] Audio récupéré du cache: %s", cache_key)
-            return self.audio_cache[cache_key]
+        if cache_key is None:
+            cache_key = self._cache_key(text, speed)
+        cached_audio = self.audio_cache.get(cache_key)
+        if cached_audio is not None:
+            self.audio_cache.move_to_end(cache_key)
+            logger.debug("[CACHE] Audio récupéré du cache: %.50s", text)
+            return cached_audio
 
         start_time = time.time()
         
@@ -154,8 +213,7 @@ class TextToSpeech:
                 synthesis_time = time.time() - start_time
                 logger.info("[AUDIO] Synthèse audio en %.2fs - %d caractères", synthesis_time, len(text))
                 
-                if cache_key and len(self.audio_cache) < self.max_cache_size:
-                    self.audio_cache[cache_key] = audio_data
+                self._cache_put(cache_key, audio_data)
                 
                 return audio_data
             else:
@@ -166,6 +224,157 @@ class TextToSpeech:
             logger.error("[ERREUR] Erreur de synthèse: %s", e)
             return None
 
+    async def synthesize_async(self, text: str, speed: float = 1.0) -> Optional[np.ndarray]:
+        """Variante asynchrone de synthesize : le processus Piper CLI ne bloque pas la boucle."""
+        if not self.current_voice or self.current_voice["type"] == "py":
+            return await asyncio.to_thread(self.synthesize, text, speed)
+        
+        text = nettoyer_markdown(text)
+        if not text.strip():
+            logger.warning("Texte vide fourni à la synthèse")
+            return None
+        
+        cache_key = self._cache_key(text, speed)
+        cached_audio = self.audio_cache.get(cache_key)
+        if cached_audio is not None:
+            self.audio_cache.move_to_end(cache_key)
+            return cached_audio
+        
+        audio_data = await self._synthesize_cli_async(text, speed)
+        if audio_data is None:
+            return None
+        if speed != 1.0:
+            audio_data = self._adjust_speed(audio_data, speed, self.current_voice.get("sample_rate", 22050))
+        self._cache_put(cache_key, audio_data)
+        return audio_data
+
+    def synthesize_stream(self, text: str, speed: float = 1.0) -> Iterator[np.ndarray]:
+        """Synthétise en flux : produit des blocs int16 au fil de la génération.
+
+        Le cache ne s'applique pas ici. En CLI, la vitesse passe par --length_scale
+        et un code de sortie non nul de Piper lève RuntimeError après le dernier bloc.
+        """
+        if not self.current_voice:
+            logger.error("❌ Aucune voix chargée - appel à load_voice() manquant?")
+            return
+        
+        text = nettoyer_markdown(text)
+        if not text.strip():
+            logger.warning("Texte vide fourni à la synthèse")
+            return
+        
+        sample_rate = self.current_voice.get("sample_rate", 22050)
+        
+        if self.current_voice["type"] == "py" and self.use_python_lib:
+            int16 = np.int16
+            for chunk in self.current_voice["voice"].synthesize(text):
+                audio_data = (chunk.audio_float_array * 32767).astype(int16)
+                if speed != 1.0:
+                    audio_data = self._adjust_speed(audio_data, speed, sample_rate)
+                yield audio_data
+            return
+        
+        chunk_bytes = max(1, int(sample_rate * _STREAM_CHUNK_SECONDS)) * 2
+        cmd = self._piper_command(speed)
+        
+        # stderr part dans un fichier : un tube non lu bloquerait Piper une fois plein
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file
+                )
+            except FileNotFoundError:
+                logger.error("[ERREUR] Commande Piper non trouvée")
+                return
+            
+            try:
+                process.stdin.write(text.encode("utf-8"))
+                process.stdin.close()
+                
+                # Lookups résolus une fois hors de la boucle (un tour par bloc de ~20 ms)
+                read, frombuffer, int16 = process.stdout.read, np.frombuffer, np.int16
+                while True:
+                    buffer = read(chunk_bytes)
+                    if not buffer:
+                        break
+                    usable = len(buffer) - len(buffer) % 2
+                    if usable:
+                        yield frombuffer(buffer[:usable], dtype=int16)
+                
+                returncode = process.wait(timeout=_CLI_TIMEOUT)
+                if returncode != 0:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode("utf-8", "replace")
+                    logger.error("[ERREUR] Erreur CLI Piper (flux): %s", stderr)
+                    raise RuntimeError(f"Piper a échoué (code {returncode}): {stderr}")
+            except subprocess.TimeoutExpired:
+                logger.error("[TIMEOUT] Timeout CLI Piper (flux)")
+                raise
+            finally:
+                process.stdout.close()
+                # Flux abandonné par l'appelant, timeout ou erreur : ne pas laisser Piper orphelin
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+
+    def synthesize_batch(self, texts: List[str], speed: float = 1.0) -> List[Optional[np.ndarray]]:
+        """Synthétise plusieurs textes; les absents du cache partent en un seul appel moteur.
+
+        Retourne une liste alignée sur ``texts`` (None pour un texte vide ou en échec).
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        
+        if not self.current_voice:
+            logger.error("❌ Aucune voix chargée - appel à load_voice() manquant?")
+            return results
+        
+        # Résolution en masse dans le cache, regroupement des doublons manquants
+        pending: Dict[CacheKey, tuple] = {}
+        for index, raw_text in enumerate(texts):
+            text = nettoyer_markdown(raw_text)
+            if not text.strip():
+                continue
+            cache_key = self._cache_key(text, speed)
+            cached_audio = self.audio_cache.get(cache_key)
+            if cached_audio is not None:
+                self.audio_cache.move_to_end(cache_key)
+                results[index] = cached_audio
+            else:
+                pending.setdefault(cache_key, (text, []))[1].append(index)
+        
+        if not pending:
+            return results
+        
+        keys = list(pending)
+        miss_texts = [pending[key][0] for key in keys]
+        start_time = time.time()
+        
+        try:
+            if self.current_voice["type"] == "py" and self.use_python_lib:
+                with ThreadPoolExecutor(max_workers=min(4, len(miss_texts))) as pool:
+                    audios = list(pool.map(self._synthesize_python_simple, miss_texts))
+            else:
+                audios = self._synthesize_cli_batch(miss_texts, speed)
+        except Exception as e:
+            logger.error("[ERREUR] Erreur de synthèse par lot: %s", e)
+            return results
+        
+        for cache_key, audio_data in zip(keys, audios):
+            if audio_data is None:
+                continue
+            if speed != 1.0:
+                audio_data = self._adjust_speed(audio_data, speed, self.current_voice.get("sample_rate", 22050))
+            self._cache_put(cache_key, audio_data)
+            for index in pending[cache_key][1]:
+                results[index] = audio_data
+        
+        logger.info("[AUDIO] Synthèse par lot en %.2fs - %d textes (%d hors cache)",
+                    time.time() - start_time, len(texts), len(miss_texts))
+        return results
+
     def _play_end_beep(self, p):
         """Joue un bip de fin avec le bon sample rate."""
         try:
@@ -260,19 +469,20 @@ class TextToSpeech:
             return self._synthesize_cli(text, 1.0)
 
 
-    def _synthesize_cli(self, text: str, speed: float) -> Optional[np.ndarray]:
-        """Synthèse avec la CLI Piper."""
-        temp_wav_path = os.path.join(tempfile.gettempdir(), f"piper_temp_{uuid.uuid4()}.wav")
+    def _piper_command(self, speed: float, json_input: bool = False) -> List[str]:
+        """Construit la commande Piper CLI : PCM brut sur stdout, ou lot de requêtes JSON sur stdin."""
+        cmd = ["piper", "--model", self.current_voice["model_path"],
+               "--json-input" if json_input else "--output-raw"]
         
+        if speed != 1.0:
+            cmd.extend(["--length_scale", str(1.0 / speed)])
+        
+        return cmd
+
+    def _synthesize_cli(self, text: str, speed: float) -> Optional[np.ndarray]:
+        """Synthèse avec la CLI Piper, PCM lu directement sur stdout (aucun fichier temporaire)."""
         try:
-            cmd = [
-                "piper", 
-                "--model", self.current_voice["model_path"],
-                "--output_file", temp_wav_path,
-            ]
-            
-            if speed != 1.0:
-                cmd.extend(["--length_scale", str(1.0 / speed)])
+            cmd = self._piper_command(speed)
             
             logger.debug("[CLI] Commande Piper: %s", " ".join(cmd))
             
@@ -280,33 +490,15 @@ class TextToSpeech:
                 cmd,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.PIPE
             )
             
-            stdout, stderr = process.communicate(input=text, timeout=30)
-            
-            if process.returncode != 0:
-                logger.error("[ERREUR] Erreur CLI Piper: %s", stderr)
-                return None
-            
-            if not os.path.exists(temp_wav_path):
-                logger.error("[ERREUR] Fichier de sortie non créé: %s", temp_wav_path)
-                return None
-            
-            with wave.open(temp_wav_path, "rb") as wav_file:
-                frames = wav_file.readframes(wav_file.getnframes())
-                audio_data = np.frombuffer(frames, dtype=np.int16)
-                
-                if wav_file.getnchannels() == 2:
-                    audio_data = audio_data.reshape(-1, 2).mean(axis=1).astype(np.int16)
-                
-                logger.debug("[CLI] Audio généré: %d échantillons, %d Hz", 
-                           len(audio_data), wav_file.getframerate())
-                
-                return audio_data
+            stdout, stderr = process.communicate(input=text.encode("utf-8"), timeout=_CLI_TIMEOUT)
+            return self._decode_cli_output(process.returncode, stdout, stderr)
                 
         except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
             logger.error("[TIMEOUT] Timeout CLI Piper")
             return None
         except FileNotFoundError:
@@ -315,29 +507,151 @@ class TextToSpeech:
         except Exception as e:
             logger.error("[ERREUR] Erreur synthèse CLI: %s", e)
             return None
-        finally:
-            if os.path.exists(temp_wav_path):
-                try:
-                    os.unlink(temp_wav_path)
-                except Exception as e:
-                    logger.warning("[ATTENTION] Impossible de supprimer le fichier temporaire: %s", e)
+
+    async def _synthesize_cli_async(self, text: str, speed: float, timeout: float = _CLI_TIMEOUT) -> Optional[np.ndarray]:
+        """Synthèse avec la CLI Piper via asyncio.create_subprocess_exec (PCM brut sur stdout)."""
+        try:
+            cmd = self._piper_command(speed)
+            logger.debug("[CLI] Commande Piper (async): %s", " ".join(cmd))
+            
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(text.encode("utf-8")), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.error("[TIMEOUT] Timeout CLI Piper")
+                return None
+            
+            return self._decode_cli_output(process.returncode, stdout, stderr)
+            
+        except FileNotFoundError:
+            logger.error("[ERREUR] Commande Piper non trouvée")
+            return None
+        except Exception as e:
+            logger.error("[ERREUR] Erreur synthèse CLI: %s", e)
+            return None
+
+    def _synthesize_cli_batch(self, texts: List[str], speed: float) -> List[Optional[np.ndarray]]:
+        """Synthèse de plusieurs textes avec un seul processus Piper (--json-input)."""
+        with tempfile.TemporaryDirectory(prefix="piper_batch_") as temp_dir:
+            wav_paths = [os.path.join(temp_dir, f"{index}.wav") for index in range(len(texts))]
+            cmd = self._piper_command(speed, json_input=True)
+            payload = "".join(
+                json.dumps({"text": text, "output_file": path}, ensure_ascii=False) + "\n"
+                for text, path in zip(texts, wav_paths)
+            )
+            logger.debug("[CLI] Commande Piper (lot de %d): %s", len(texts), " ".join(cmd))
+            
+            timeout = min(_CLI_TIMEOUT * len(texts), _CLI_BATCH_TIMEOUT_MAX)
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True
+                )
+            except FileNotFoundError:
+                logger.error("[ERREUR] Commande Piper non trouvée")
+                return [None] * len(texts)
+            
+            try:
+                stdout, stderr = process.communicate(input=payload, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                # Tuer Piper avant que TemporaryDirectory ne supprime ses fichiers de sortie
+                process.kill()
+                process.communicate()
+                logger.error("[TIMEOUT] Timeout CLI Piper (lot)")
+                return [None] * len(texts)
+            
+            if process.returncode != 0:
+                logger.error("[ERREUR] Erreur CLI Piper: %s", stderr)
+                return [None] * len(texts)
+            
+            return [self._read_wav(path) if os.path.exists(path) else None for path in wav_paths]
+
+    def _read_wav(self, wav_path: Union[str, BinaryIO]) -> np.ndarray:
+        """Lit un fichier WAV 16 bits et le ramène en mono."""
+        with wave.open(wav_path, "rb") as wav_file:
+            frames = wav_file.readframes(wav_file.getnframes())
+            audio_data = np.frombuffer(frames, dtype=np.int16)
+            
+            if wav_file.getnchannels() == 2:
+                audio_data = audio_data.reshape(-1, 2).mean(axis=1).astype(np.int16)
+            
+            logger.debug("[CLI] Audio généré: %d échantillons, %d Hz", 
+                       len(audio_data), wav_file.getframerate())
+            
+            return audio_data
+
+    def _decode_cli_output(self, returncode: int, stdout: bytes, stderr: bytes) -> Optional[np.ndarray]:
+        """Vérifie le résultat de ``piper --output-raw`` et décode le PCM reçu."""
+        if returncode != 0:
+            logger.error("[ERREUR] Erreur CLI Piper: %s", stderr.decode("utf-8", "replace"))
+            return None
+        
+        if not stdout:
+            logger.error("[ERREUR] Aucune donnée audio reçue de Piper")
+            return None
+        
+        return self._read_raw(stdout)
+
+    def _read_raw(self, pcm: bytes) -> np.ndarray:
+        """Convertit le PCM 16 bits mono émis par ``piper --output-raw``."""
+        audio_data = np.frombuffer(pcm[:len(pcm) - len(pcm) % 2], dtype=np.int16)
+        
+        logger.debug("[CLI] Audio généré: %d échantillons, %d Hz", 
+                   len(audio_data), self.current_voice.get("sample_rate", 22050))
+        
+        return audio_data
 
     def _adjust_speed(self, audio_data: np.ndarray, speed: float, sample_rate: int) -> np.ndarray:
         """Ajuste la vitesse de l'audio."""
         if speed == 1.0:
             return audio_data
-            
+        
+        # Chemin principal : librosa.time_stretch conserve la hauteur de la voix
         try:
             import librosa
-            audio_float = audio_data.astype(np.float32) / 32768.0
+            audio_float = _pcm16_to_float(audio_data)
             adjusted_audio = librosa.effects.time_stretch(audio_float, rate=speed)
-            adjusted_audio = (adjusted_audio * 32768.0).astype(np.int16)
+            adjusted_audio = _float_to_pcm16(np.asarray(adjusted_audio, dtype=np.float32))
             logger.debug("[AUDIO] Vitesse ajustée: %.2fx", speed)
             return adjusted_audio
             
         except ImportError:
-            logger.warning("[ATTENTION] Librosa non disponible, vitesse non ajustée")
+            logger.debug("[AUDIO] Librosa non disponible, repli sur un rééchantillonnage")
+        except Exception as e:
+            logger.warning("[ATTENTION] Erreur ajustement vitesse: %s", e)
             return audio_data
+        
+        # Derniers recours : rééchantillonnage (la hauteur suit la vitesse)
+        try:
+            from scipy import signal
+            up, down = 1000, int(round(1000 * speed))
+            divisor = math.gcd(up, down)
+            resampled = signal.resample_poly(audio_data.astype(np.float32), up // divisor, down // divisor)
+            adjusted_audio = np.clip(resampled, -32768, 32767).astype(np.int16)
+            logger.debug("[AUDIO] Vitesse ajustée (scipy): %.2fx", speed)
+            return adjusted_audio
+        except ImportError:
+            logger.debug("[AUDIO] scipy non disponible, rééchantillonnage linéaire")
+        except Exception as e:
+            logger.warning("[ATTENTION] Erreur rééchantillonnage scipy: %s", e)
+        
+        try:
+            from ..core._dsp import resample_linear
+            resampled = resample_linear(audio_data, speed)
+            adjusted_audio = np.clip(resampled, -32768, 32767).astype(np.int16)
+            logger.debug("[AUDIO] Vitesse ajustée (linéaire): %.2fx", speed)
+            return adjusted_audio
         except Exception as e:
             logger.warning("[ATTENTION] Erreur ajustement vitesse: %s", e)
             return audio_data
@@ -473,6 +787,20 @@ class TextToSpeech:
             logger.error("[TEST] ❌ Synthèse vocale échouée")
             return False
 
+    def optimize_cache(self, target_size: Optional[int] = None) -> int:
+        """Évince les entrées les moins récemment utilisées jusqu'à target_size."""
+        if target_size is None:
+            target_size = self.max_cache_size // 2
+        
+        evicted = 0
+        while len(self.audio_cache) > target_size:
+            self.audio_cache.popitem(last=False)
+            evicted += 1
+        
+        if evicted:
+            logger.info("[CACHE] %d entrées audio évincées", evicted)
+        return evicted
+
     def cleanup(self):
         """Nettoie les ressources."""
         self.audio_cache.clear()
@@ -422,10 +422,9 @@ class ProjectAnalyzerService:
 
 ## 💡 Recommandations
 """
-            for i, rec in enumerate(report.get('recommendations', []), 1):
-                md += f"{i}. {rec}\n"
-            
-            return md
+            return md + "".join(
+                f"{i}. {rec}\n" for i, rec in enumerate(report.get('recommendations', []), 1)
+            )
             
         except Exception as e:
             logger.error(f"Erreur conversion Markdown: {e}")
@@ -445,10 +444,9 @@ ANALYSE:
 
 RECOMMANDATIONS:
 """
-            for i, rec in enumerate(report.get('recommendations', []), 1):
-                text += f"  {i}. {rec}\n"
-            
-            return text
+            return text + "".join(
+                f"  {i}. {rec}\n" for i, rec in enumerate(report.get('recommendations', []), 1)
+            )
             
         except Exception as e:
             logger.error(f"Erreur conversion texte: {e}")
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Type
+from typing import Optional, List, Tuple, Type
+import functools
 import os
 import sys
 from ..config.config import config
@@ -17,6 +18,14 @@ def _get_piper_class():
         return sys.modules['src.core.tts_service'].PiperTTSAdapter
     return PiperTTSAdapter
 
+@functools.lru_cache(maxsize=4)
+def _scan_voices(folder: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Liste les dossiers de voix; mis en cache tant que le mtime du dossier ne change pas.
+
+    Les erreurs d'accès sont propagées pour ne jamais mettre en cache un échec.
+    """
+    return tuple(d for d in os.listdir(folder) if os.path.isdir(os.path.join(folder, d)))
+
 class ITTSAdapter(ABC):
     """Interface pour les adaptateurs TTS"""
     
@@ -92,9 +101,9 @@ class PiperTTSAdapter(ITTSAdapter):
         """Retourne les voix disponibles"""
         try:
             if os.path.exists(config.VOICES_FOLDER):
-                voices = [d for d in os.listdir(config.VOICES_FOLDER) 
-                         if os.path.isdir(os.path.join(config.VOICES_FOLDER, d))]
-                return voices if voices else ["fr_FR-siwis-medium"]
+                mtime_ns = os.stat(config.VOICES_FOLDER).st_mtime_ns
+                voices = _scan_voices(config.VOICES_FOLDER, mtime_ns)
+                return list(voices) if voices else ["fr_FR-siwis-medium"]
             return ["fr_FR-siwis-medium"]
         except Exception as e:
             _get_logger().error(f"Erreur获取 voix: {e}")
@@ -103,6 +112,8 @@ class PiperTTSAdapter(ITTSAdapter):
     def optimize_cache(self) -> bool:
         """Optimise le cache"""
         try:
+            if self._tts is not None:
+                self._tts.optimize_cache()
             _get_logger().info("Cache vocal optimisé")
             return True
         except Exception as e:
@@ -1,4 +1,5 @@
 import logging
+import os
 import threading
 from typing import List, Dict, Optional
 import gradio as gr
@@ -12,6 +13,21 @@ from ..utils.logger import logger
 from pathlib import Path
 import re
 
+# Motifs compilés une seule fois à l'import (ordre de priorité conservé).
+# Moteur ``re`` : \s y couvre les espaces Unicode (espace insécable du français).
+_PATH_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"dans\s+(.+)",
+        r"du\s+(.+)",
+        r"sur\s+(.+)",
+        r"chemin\s+(.+)",
+        r"répertoire\s+(.+)",
+    )
+)
+_TRAILING_PUNCTUATION = re.compile(r'[.,;!?]$')
+
+
 class InterfaceHelpers:
     """Classe helper pour les opérations communes de l'interface."""
     def __init__(self):
@@ -134,19 +150,11 @@ class InterfaceHelpers:
 
     def extract_path_from_command(self, text: str) -> Optional[Path]:
         """Extrait un chemin d'une commande vocale."""
-        patterns = [
-            r"dans\s+(.+)",
-            r"du\s+(.+)", 
-            r"sur\s+(.+)",
-            r"chemin\s+(.+)",
-            r"répertoire\s+(.+)"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PATH_PATTERNS:
+            match = pattern.search(text)
             if match:
                 path = match.group(1).strip()
-                path = re.sub(r'[.,;!?]$', '', path)
+                path = _TRAILING_PUNCTUATION.sub('', path)
                 path_obj = Path(path)
                 if path_obj.exists():
                     return path_obj
@@ -2,15 +2,31 @@
 Interface Web Gradio pour l'Assistant Vocal Intelligent
 """
 
-import gradio as gr
-from gradio import themes
+import importlib
 import threading
 import time
 import json
+from types import ModuleType
 from typing import List, Dict, Any, Optional, Tuple
 from src.utils.logger import logger
 from src.services.audio_controller import AudioController
 
+
+class _LazyModule:
+    """Importe le module au premier accès à un attribut (gradio coûte cher à charger)."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+gr = _LazyModule("gradio")
+
 class GradioWebInterface:
     """
     Interface web Gradio avancée pour l'assistant vocal.
@@ -33,7 +49,7 @@ class GradioWebInterface:
         self.user_input = None
         # ... autres composants
     
-    def create_interface(self) -> gr.Blocks:
+    def create_interface(self) -> "gr.Blocks":
         """Crée l'interface Gradio complète."""
         with gr.Blocks(title="Assistant Vocal Intelligent") as demo:
             self.demo = demo
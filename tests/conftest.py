@@ -1,13 +1,88 @@
 # tests/conftest.py
 import sys
 import os
+import importlib.util
+import types
 import pytest
 import numpy as np
+from unittest.mock import Mock
 
 # Ajouter src au path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+
+def _fake_pyaudio() -> types.ModuleType:
+    """Module pyaudio sans PortAudio : aucun périphérique, aucun flux réel."""
+    module = types.ModuleType("pyaudio")
+    module.paInt16, module.paFloat32, module.paContinue = 8, 1, 0
+
+    class Stream:
+        def read(self, frames, exception_on_overflow=True):
+            return b"\x00\x00" * frames
+
+        def write(self, data):
+            pass
+
+        def start_stream(self):
+            pass
+
+        def stop_stream(self):
+            pass
+
+        def close(self):
+            pass
+
+    class PyAudio:
+        def get_device_count(self):
+            return 0
+
+        def get_device_info_by_index(self, index):
+            raise IOError(f"Périphérique {index} inexistant")
+
+        def open(self, *args, **kwargs):
+            return Stream()
+
+        def terminate(self):
+            pass
+
+    module.Stream, module.PyAudio = Stream, PyAudio
+    return module
+
+
+def _fake_vosk() -> types.ModuleType:
+    """Module vosk minimal : modèle vide, reconnaissance toujours muette."""
+    module = types.ModuleType("vosk")
+
+    class Model:
+        def __init__(self, model_path=None):
+            self.model_path = model_path
+
+    class KaldiRecognizer:
+        def __init__(self, model, sample_rate, *args):
+            self.model, self.sample_rate = model, sample_rate
+
+        def AcceptWaveform(self, data):
+            return False
+
+        def Result(self):
+            return '{"text": ""}'
+
+        def PartialResult(self):
+            return '{"partial": ""}'
+
+    module.Model, module.KaldiRecognizer = Model, KaldiRecognizer
+    return module
+
+
+# MARIO_FAKE_AUDIO=1 : remplace pyaudio/vosk absents par des faux sans E/S, pour
+# collecter les tests audio sur une CI sans PortAudio (ou sous xdist --forked).
+# Un module réellement installé n'est jamais masqué.
+if os.environ.get("MARIO_FAKE_AUDIO"):
+    for _name, _factory in (("pyaudio", _fake_pyaudio), ("vosk", _fake_vosk)):
+        if _name not in sys.modules and importlib.util.find_spec(_name) is None:
+            sys.modules[_name] = _factory()
+
 @pytest.fixture
 def sample_audio():
     """Fixture pour audio de test (1 seconde de silence)"""
@@ -18,6 +93,60 @@ def sample_audio_2sec():
     """Fixture pour audio de test (2 secondes)"""
     return np.zeros(32000, dtype=np.int16)
 
+# Durées du dernier passage, conservées dans .pytest_cache pour ordonner la collecte.
+_DURATIONS_KEY = "mario/durations"
+_durations = {}
+
+
+def pytest_itemcollected(item):
+    """Regroupe les tests marqués ``serial`` sur un seul worker xdist (--dist=loadgroup)."""
+    if item.get_closest_marker("serial"):
+        item.add_marker(pytest.mark.xdist_group("serial"))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Exécute d'abord les modules rapides (les modules inconnus passent en tête).
+
+    Seuls les modules sont réordonnés, en bloc : l'ordre interne est conservé
+    pour que les fixtures de portée module/classe ne soient construites qu'une fois.
+    """
+    cache = getattr(config, "cache", None)  # absent avec -p no:cacheprovider
+    durations = cache.get(_DURATIONS_KEY, {}) if cache else {}
+    if not durations:
+        return
+    module_totals = {}
+    for item in items:
+        module = item.nodeid.split("::", 1)[0]
+        module_totals[module] = module_totals.get(module, 0.0) + durations.get(item.nodeid, 0.0)
+    items.sort(key=lambda item: module_totals[item.nodeid.split("::", 1)[0]])
+
+
+def pytest_runtest_logreport(report):
+    if report.when == "call":
+        _durations[report.nodeid] = report.duration
+
+
+def pytest_sessionfinish(session):
+    cache = getattr(session.config, "cache", None)
+    # Sous xdist, seul le contrôleur reçoit les rapports de tous les workers.
+    if _durations and cache and not hasattr(session.config, "workerinput"):
+        cache.set(_DURATIONS_KEY, {**cache.get(_DURATIONS_KEY, {}), **_durations})
+
+
+_UNSET = object()
+
+@pytest.fixture
+def stub_module(monkeypatch):
+    """Fixture pour remplacer un module dans sys.modules (restauré en fin de test).
+
+    ``stub_module("piper")`` installe un Mock; ``stub_module("piper", None)`` rend l'import impossible.
+    """
+    def _stub(name, obj=_UNSET):
+        module = Mock() if obj is _UNSET else obj
+        monkeypatch.setitem(sys.modules, name, module)
+        return module
+    return _stub
+
 @pytest.fixture
 def mock_assistant():
     """Fixture pour un assistant mocké"""
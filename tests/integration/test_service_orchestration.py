@@ -1,20 +1,14 @@
-import unittest
-import sys
-import os
 import numpy as np
 
-# Ajouter le chemin src pour les imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from src.core.tts_service import TTSService
 from src.core.speech_recognition_service import SpeechRecognitionService
 from src.core.wake_word_service import WakeWordService
 from src.core.llm_service import LLMService
 
-class TestServiceOrchestration(unittest.TestCase):
+class TestServiceOrchestration:
     """Tests d'orchestration pour vérifier l'interaction entre les services"""
     
-    def setUp(self):
+    def setup_method(self):
         """Initialisation des services avec adaptateurs simulés"""
         self.tts_service = TTSService.create_with_piper("fr_FR-siwis-medium")
         self.stt_service = SpeechRecognitionService.create_with_simulation()
@@ -37,9 +31,9 @@ class TestServiceOrchestration(unittest.TestCase):
         tts_result = self.tts_service.speak(llm_response)
         
         # Vérifier que tout fonctionne
-        self.assertTrue(tts_result)
-        self.assertIsInstance(llm_response, str)
-        self.assertIn("Bonjour", llm_response)
+        assert tts_result
+        assert isinstance(llm_response, str)
+        assert "Bonjour" in llm_response
     
     def test_stt_to_llm_interaction(self):
         """Test de l'interaction STT -> LLM"""
@@ -54,14 +48,14 @@ class TestServiceOrchestration(unittest.TestCase):
         llm_response = self.llm_service.generate_response(messages)
         
         # Vérifier l'interaction
-        self.assertIsInstance(transcribed_text, str)
-        self.assertIsInstance(llm_response, str)
+        assert isinstance(transcribed_text, str)
+        assert isinstance(llm_response, str)
     
     def test_wake_word_to_full_pipeline(self):
         """Test du pipeline complet : Wake Word -> STT -> LLM -> TTS"""
         # Simuler la détection du mot-clé
         wake_detected = True
-        self.assertTrue(wake_detected)
+        assert wake_detected
         
         # Simuler la capture audio après le mot-clé
         test_audio = np.zeros(32000, dtype=np.int16)  # 2 secondes
@@ -77,9 +71,9 @@ class TestServiceOrchestration(unittest.TestCase):
         tts_result = self.tts_service.speak(llm_response)
         
         # Vérifier que tout le pipeline fonctionne
-        self.assertTrue(tts_result)
-        self.assertIsInstance(transcribed_text, str)
-        self.assertIsInstance(llm_response, str)
+        assert tts_result
+        assert isinstance(transcribed_text, str)
+        assert isinstance(llm_response, str)
     
     def test_service_lifecycle(self):
         """Test du cycle de vie complet des services"""
@@ -89,10 +83,10 @@ class TestServiceOrchestration(unittest.TestCase):
         # LLMService n'a pas d'attribut is_available non plus
         
         # Vérifier que les services essentiels sont disponibles
-        self.assertTrue(hasattr(self.tts_service, 'is_available'))
-        self.assertTrue(self.tts_service.is_available)
-        self.assertTrue(hasattr(self.stt_service, 'is_available'))
-        self.assertTrue(self.stt_service.is_available)
+        assert hasattr(self.tts_service, 'is_available')
+        assert self.tts_service.is_available
+        assert hasattr(self.stt_service, 'is_available')
+        assert self.stt_service.is_available
         # LLMService et WakeWordService n'ont pas is_available, c'est normal
         
         # Test de fonctionnalités
@@ -102,7 +96,7 @@ class TestServiceOrchestration(unittest.TestCase):
         test_results.append(self.tts_service.test_synthesis())
         
         # Au moins un test doit réussir
-        self.assertTrue(any(test_results))
+        assert any(test_results)
         
         # Test de nettoyage (unload)
         unload_results = []
@@ -113,6 +107,3 @@ class TestServiceOrchestration(unittest.TestCase):
         
         # Les unload ne sont pas obligatoires, mais s'ils existent ils doivent fonctionner
         # On ne vérifie pas le résultat car certains unload peuvent échouer en simulation
-
-if __name__ == '__main__':
-    unittest.main()
@@ -1,27 +1,22 @@
-import unittest
 from unittest.mock import MagicMock, patch
-import sys
-import os
 import time
 
-# Ajouter le chemin src pour les imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.core.performance_optimizer import AlertFlags, PerformanceOptimizer
 
-from src.core.performance_optimizer import PerformanceOptimizer
-
-class TestPerformanceOptimizer(unittest.TestCase):
+class TestPerformanceOptimizer:
     """Tests pour PerformanceOptimizer"""
 
-    def setUp(self):
+    def setup_method(self):
         """Initialisation avant chaque test"""
         self.optimizer = PerformanceOptimizer()
 
     def test_initialization(self):
         """Test d'initialisation de l'optimiseur"""
-        self.assertFalse(self.optimizer.is_monitoring)
-        self.assertIsNotNone(self.optimizer.performance_stats)
-        self.assertIsNotNone(self.optimizer.alert_thresholds)
-        self.assertEqual(self.optimizer.optimization_cooldown, 60)
+        assert not self.optimizer.is_monitoring
+        assert self.optimizer.performance_stats is not None
+        assert self.optimizer.alert_thresholds is not None
+        assert self.optimizer.optimization_cooldown == 60
+        assert not hasattr(self.optimizer, '__dict__')
 
     @patch('src.core.performance_optimizer.psutil')
     def test_collect_stats_basic(self, mock_psutil):
@@ -36,12 +31,12 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         stats = self.optimizer._collect_stats()
         
-        self.assertIn('cpu_percent', stats)
-        self.assertIn('memory_percent', stats)
-        self.assertIn('memory_available_gb', stats)
-        self.assertIn('memory_used_gb', stats)
-        self.assertEqual(stats['cpu_percent'], 25.0)
-        self.assertEqual(stats['memory_percent'], 45.0)
+        assert 'cpu_percent' in stats
+        assert 'memory_percent' in stats
+        assert 'memory_available_gb' in stats
+        assert 'memory_used_gb' in stats
+        assert stats['cpu_percent'] == 25.0
+        assert stats['memory_percent'] == 45.0
 
     @patch('src.core.performance_optimizer.psutil')
     @patch('src.core.performance_optimizer.torch')
@@ -64,9 +59,9 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         stats = self.optimizer._collect_stats()
         
-        self.assertIn('gpu_memory_used_mb', stats)
-        self.assertIn('gpu_memory_reserved_mb', stats)
-        self.assertIn('gpu_memory_total_mb', stats)
+        assert 'gpu_memory_used_mb' in stats
+        assert 'gpu_memory_reserved_mb' in stats
+        assert 'gpu_memory_total_mb' in stats
 
     def test_store_stats(self):
         """Test du stockage des statistiques"""
@@ -90,9 +85,9 @@ class TestPerformanceOptimizer(unittest.TestCase):
         self.optimizer._store_stats(test_stats)
         
         # Vérifier que les stats sont stockées
-        self.assertGreater(len(self.optimizer.performance_stats['cpu_percent']), 0)
-        self.assertGreater(len(self.optimizer.performance_stats['memory_percent']), 0)
-        self.assertGreater(len(self.optimizer.performance_stats['gpu_memory']), 0)
+        assert len(self.optimizer.performance_stats['cpu_percent']) > 0
+        assert len(self.optimizer.performance_stats['memory_percent']) > 0
+        assert len(self.optimizer.performance_stats['gpu_memory']) > 0
 
     def test_store_stats_limit(self):
         """Test de la limitation du stockage des statistiques"""
@@ -106,27 +101,39 @@ class TestPerformanceOptimizer(unittest.TestCase):
             self.optimizer._store_stats(test_stats)
         
         # Vérifier que la limite est respectée
-        self.assertLessEqual(len(self.optimizer.performance_stats['cpu_percent']), 100)
+        assert len(self.optimizer.performance_stats['cpu_percent']) <= 100
+
+    def test_store_stats_ring_buffer_order(self):
+        """Test de l'ordre chronologique après rebouclage du tampon circulaire"""
+        for i in range(150):
+            self.optimizer._store_stats({'cpu_percent': float(i)})
+        
+        values = self.optimizer.performance_stats['cpu_percent'].values()
+        
+        assert len(values) == 100
+        assert values[0] == 50.0
+        assert values[-1] == 149.0
+        assert self.optimizer._calculate_trend(self.optimizer.performance_stats['cpu_percent']) == "stable"
 
     def test_check_alerts_cpu_high(self):
         """Test de vérification des alertes CPU élevée"""
         self.optimizer.alert_thresholds['cpu_max'] = 80.0
         test_stats = {'cpu_percent': 85.0}
         
-        alerts = self.optimizer._check_alerts(test_stats)
+        flags = self.optimizer._check_alert_flags(test_stats)
         
-        self.assertGreater(len(alerts), 0)
-        self.assertTrue(any('CPU élevé' in alert for alert in alerts))
+        assert flags & AlertFlags.CPU_HIGH
+        assert self.optimizer._check_alerts(test_stats) == ['CPU élevé: 85.0%']
 
     def test_check_alerts_memory_high(self):
         """Test de vérification des alertes mémoire élevée"""
         self.optimizer.alert_thresholds['memory_max'] = 80.0
         test_stats = {'memory_percent': 85.0}
         
-        alerts = self.optimizer._check_alerts(test_stats)
+        flags = self.optimizer._check_alert_flags(test_stats)
         
-        self.assertGreater(len(alerts), 0)
-        self.assertTrue(any('Mémoire élevée' in alert for alert in alerts))
+        assert flags & AlertFlags.MEMORY_HIGH
+        assert not (flags & AlertFlags.CPU_HIGH)
 
     def test_check_alerts_gpu_high(self):
         """Test de vérification des alertes GPU élevée"""
@@ -136,10 +143,10 @@ class TestPerformanceOptimizer(unittest.TestCase):
             'gpu_memory_total_mb': 1000.0
         }
         
-        alerts = self.optimizer._check_alerts(test_stats)
+        flags = self.optimizer._check_alert_flags(test_stats)
         
-        self.assertGreater(len(alerts), 0)
-        self.assertTrue(any('GPU mémoire élevée' in alert for alert in alerts))
+        assert flags & AlertFlags.GPU_MEMORY_HIGH
+        assert self.optimizer._check_alerts(test_stats) == ['GPU mémoire élevée: 85.0%']
 
     @patch('src.core.performance_optimizer.torch')
     @patch('src.core.performance_optimizer.gc')
@@ -150,7 +157,7 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         result = self.optimizer.optimize_memory()
         
-        self.assertTrue(result)
+        assert result
         mock_torch.cuda.empty_cache.assert_called_once()
         mock_gc.collect.assert_called_once()
 
@@ -163,7 +170,7 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         result = self.optimizer.optimize_memory(aggressive=True)
         
-        self.assertTrue(result)
+        assert result
         mock_torch.cuda.empty_cache.assert_called_once()
         mock_gc.collect.assert_called_once()
 
@@ -174,26 +181,26 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         result = self.optimizer.optimize_models()
         
-        self.assertTrue(result)
+        assert result
         mock_torch.cuda.empty_cache.assert_called_once()
 
     def test_calculate_trend_increasing(self):
         """Test de calcul de tendance croissante"""
         values = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
         trend = self.optimizer._calculate_trend(values)
-        self.assertEqual(trend, "increasing")
+        assert trend == "increasing"
 
     def test_calculate_trend_decreasing(self):
         """Test de calcul de tendance décroissante"""
         values = [100, 90, 80, 70, 60, 50, 40, 30, 20, 10]
         trend = self.optimizer._calculate_trend(values)
-        self.assertEqual(trend, "decreasing")
+        assert trend == "decreasing"
 
     def test_calculate_trend_stable(self):
         """Test de calcul de tendance stable"""
         values = [50, 52, 48, 51, 49, 50, 52, 48]
         trend = self.optimizer._calculate_trend(values)
-        self.assertEqual(trend, "stable")
+        assert trend == "stable"
 
     def test_calculate_system_health_excellent(self):
         """Test de calcul de santé système excellente"""
@@ -204,8 +211,8 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         health = self.optimizer._calculate_system_health(test_stats)
         
-        self.assertGreaterEqual(health['score'], 80)
-        self.assertEqual(health['status'], 'excellent')
+        assert health['score'] >= 80
+        assert health['status'] == 'excellent'
 
     def test_calculate_system_health_critical(self):
         """Test de calcul de santé système critique"""
@@ -218,10 +225,10 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         # Avec CPU=95% (-20) et Mémoire=95% (-25), score = 55
         # Ce n'est pas "critical" mais c'est une charge lourde
-        self.assertEqual(health['score'], 55)
-        self.assertEqual(health['status'], 'fair')  # 40-59 = fair
-        self.assertIn("CPU surchargé", health['issues'])
-        self.assertIn("Mémoire critique", health['issues'])
+        assert health['score'] == 55
+        assert health['status'] == 'fair'  # 40-59 = fair
+        assert "CPU surchargé" in health['issues']
+        assert "Mémoire critique" in health['issues']
 
     def test_get_detailed_recommendations_cpu_high(self):
         """Test de recommandations détaillées pour CPU élevé"""
@@ -229,8 +236,8 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         recommendations = self.optimizer._get_detailed_recommendations(test_stats)
         
-        self.assertGreater(len(recommendations), 0)
-        self.assertTrue(any('CPU' in rec for rec in recommendations))
+        assert len(recommendations) > 0
+        assert any('CPU' in rec for rec in recommendations)
 
     def test_get_detailed_recommendations_memory_high(self):
         """Test de recommandations détaillées pour mémoire élevée"""
@@ -241,8 +248,8 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         recommendations = self.optimizer._get_detailed_recommendations(test_stats)
         
-        self.assertGreater(len(recommendations), 0)
-        self.assertTrue(any('mémoire' in rec.lower() for rec in recommendations))
+        assert len(recommendations) > 0
+        assert any('mémoire' in rec.lower() for rec in recommendations)
 
     def test_set_thresholds(self):
         """Test de définition des seuils"""
@@ -251,17 +258,17 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         self.optimizer.set_thresholds(cpu_max=new_cpu_max)
         
-        self.assertEqual(self.optimizer.alert_thresholds['cpu_max'], new_cpu_max)
-        self.assertNotEqual(self.optimizer.alert_thresholds['cpu_max'], old_cpu_max)
+        assert self.optimizer.alert_thresholds['cpu_max'] == new_cpu_max
+        assert self.optimizer.alert_thresholds['cpu_max'] != old_cpu_max
 
     def test_get_optimization_profile(self):
         """Test de récupération du profil d'optimisation"""
         profile = self.optimizer.get_optimization_profile()
         
-        self.assertIn('thresholds', profile)
-        self.assertIn('cooldown', profile)
-        self.assertIn('cached_models', profile)
-        self.assertIn('monitoring_active', profile)
+        assert 'thresholds' in profile
+        assert 'cooldown' in profile
+        assert 'cached_models' in profile
+        assert 'monitoring_active' in profile
 
     def test_set_optimization_profile(self):
         """Test de définition du profil d'optimisation"""
@@ -272,8 +279,8 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         self.optimizer.set_optimization_profile(new_profile)
         
-        self.assertEqual(self.optimizer.alert_thresholds['cpu_max'], 95.0)
-        self.assertEqual(self.optimizer.optimization_cooldown, 120)
+        assert self.optimizer.alert_thresholds['cpu_max'] == 95.0
+        assert self.optimizer.optimization_cooldown == 120
 
     @patch('src.core.performance_optimizer.psutil')
     def test_get_resource_usage(self, mock_psutil):
@@ -288,9 +295,9 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         usage = self.optimizer.get_resource_usage()
         
-        self.assertIn('cpu', usage)
-        self.assertIn('memory', usage)
-        self.assertIn('memory_used', usage)
+        assert 'cpu' in usage
+        assert 'memory' in usage
+        assert 'memory_used' in usage
 
     def test_auto_optimize_should_not_optimize(self):
         """Test d'auto-optimisation quand ce n'est pas nécessaire"""
@@ -299,22 +306,23 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         result = self.optimizer.auto_optimize()
         
-        self.assertFalse(result)
+        assert not result
 
     def test_auto_optimize_with_force(self):
         """Test d'auto-optimisation forcée"""
-        with patch.object(self.optimizer, 'optimize_memory') as mock_optimize:
+        # PerformanceOptimizer utilise __slots__ : on patche la classe, pas l'instance
+        with patch.object(PerformanceOptimizer, 'optimize_memory') as mock_optimize:
             mock_optimize.return_value = True
             
             # Simuler des alertes pour forcer l'optimisation
-            with patch.object(self.optimizer, '_collect_stats') as mock_collect:
+            with patch.object(PerformanceOptimizer, '_collect_stats') as mock_collect:
                 mock_collect.return_value = {'memory_percent': 90.0}
-                with patch.object(self.optimizer, '_check_alerts') as mock_alerts:
+                with patch.object(PerformanceOptimizer, '_check_alerts') as mock_alerts:
                     mock_alerts.return_value = ['Alerte mémoire']
                     
                     result = self.optimizer.auto_optimize(force=True)
                     
-                    self.assertTrue(result)
+                    assert result
 
     def test_should_auto_optimize_no_alerts(self):
         """Test de vérification d'auto-optimisation sans alertes"""
@@ -325,7 +333,7 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         should_optimize = self.optimizer._should_auto_optimize(test_stats)
         
-        self.assertFalse(should_optimize)
+        assert not should_optimize
 
     def test_should_auto_optimize_with_alerts(self):
         """Test de vérification d'auto-optimisation avec alertes"""
@@ -338,7 +346,7 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         should_optimize = self.optimizer._should_auto_optimize(test_stats)
         
-        self.assertTrue(should_optimize)
+        assert should_optimize
 
     @patch('src.core.performance_optimizer.threading.Thread')
     def test_trigger_auto_optimization(self, mock_thread):
@@ -364,7 +372,4 @@ class TestPerformanceOptimizer(unittest.TestCase):
         
         # Note: The current implementation checks for 300 seconds, so this test
         # will unload models with old timestamps
-        self.assertGreaterEqual(unloaded_count, 0)
-
-if __name__ == '__main__':
-    unittest.main()
+        assert unloaded_count >= 0
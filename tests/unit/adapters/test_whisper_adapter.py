@@ -6,23 +6,27 @@ from types import SimpleNamespace
 # Import adapter
 from src.adapters.speech_recognition_whisper_adapter import WhisperSpeechRecognitionAdapter
 
-@pytest.fixture
-def mock_whisper(monkeypatch):
-    # Mock whisper to provide a model with predictable transcribe output
+@pytest.fixture(scope="module")
+def mock_whisper():
+    # Mock whisper to provide a model with predictable transcribe output.
+    # Installed once per module; restored when the module's tests are done.
     dummy_model = SimpleNamespace(transcribe=lambda audio, language="fr", fp16=False: {"text": "transcribed_15"})
-    monkeypatch.setitem(sys.modules, "whisper", SimpleNamespace(load_model=lambda name: dummy_model))
-    # Mock torch.cuda.is_available
-    monkeypatch.setitem(sys.modules, "torch", SimpleNamespace(cuda=SimpleNamespace(is_available=lambda: False)))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "whisper", SimpleNamespace(load_model=lambda name: dummy_model))
+        # Mock torch.cuda.is_available
+        mp.setitem(sys.modules, "torch", SimpleNamespace(cuda=SimpleNamespace(is_available=lambda: False)))
+        yield dummy_model
 
-@pytest.fixture
-def silence_logger(monkeypatch):
+@pytest.fixture(scope="module")
+def silence_logger():
     class DummyLogger:
         def info(self, *args, **kwargs):
             pass
         def error(self, *args, **kwargs):
             pass
-    monkeypatch.setattr("src.adapters.speech_recognition_whisper_adapter.logger", DummyLogger())
-
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.adapters.speech_recognition_whisper_adapter.logger", DummyLogger())
+        yield
 
 def test_whisper_adapter_success(mock_whisper, silence_logger):
     adapter = WhisperSpeechRecognitionAdapter("tiny")
@@ -0,0 +1,24 @@
+# tests/unit/services/conftest.py
+import pytest
+
+from src.services.conversation_service import ConversationService
+from src.services.project_analyzer_service import SimulatedLLMAdapter, ProjectAnalyzerService
+
+
+@pytest.fixture(scope="session")
+def conversation_service():
+    """Service de conversation instancié une seule fois pour la session"""
+    return ConversationService()
+
+
+@pytest.fixture
+def fresh_conversation(conversation_service):
+    """Service de conversation partagé, historique vidé avant chaque test"""
+    conversation_service.clear_history()
+    return conversation_service
+
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """Analyseur de projet sur LLM simulé (sans état entre deux analyses)"""
+    return ProjectAnalyzerService(llm_adapter=SimulatedLLMAdapter())
@@ -1,8 +1,20 @@
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 # Import the factory functions
 from src.core.app_factory import create_assistant, create_assistant_with_simulation
+from src.main import AssistantVocal
+
+class CallRecorder:
+    """Callable stub that only counts its calls (cheaper than MagicMock)."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+
 
 # Helper fixture to mock dependencies
 @pytest.fixture
@@ -11,6 +23,9 @@ def mock_dependencies(monkeypatch):
     class DummySettings:
         voice_name = "dummy_voice"
         llm_model = "dummy_model"
+        audio_buffer_size = 10
+        chunk_size = 1024
+        enable_low_latency = False
 
         @classmethod
         def from_config(cls, cfg):
@@ -21,40 +36,38 @@ def mock_dependencies(monkeypatch):
     monkeypatch.setattr("src.core.app_factory.config", {}, raising=False)
 
     # Mock MicrophoneChecker to always return True
-    mic_mock = MagicMock()
-    mic_mock.is_microphone_available.return_value = True
+    mic_mock = SimpleNamespace(is_microphone_available=lambda: True)
     monkeypatch.setattr("src.core.app_factory.MicrophoneChecker", lambda: mic_mock)
 
     # Mock TTSService factory
-    tts_mock = MagicMock(name="TTSServiceMock")
+    tts_mock = SimpleNamespace()
     monkeypatch.setattr("src.core.app_factory.TTSService", type("TTSServiceMockClass", (), {
         "create_with_piper": staticmethod(lambda *args, **kwargs: tts_mock)
     }))
 
     # Mock WakeWordService factory
-    wake_mock = MagicMock(name="WakeWordServiceMock")
+    wake_mock = SimpleNamespace()
     monkeypatch.setattr("src.core.app_factory.WakeWordService", type("WakeWordServiceMockClass", (), {
         "create_with_vosk": staticmethod(lambda *args, **kwargs: wake_mock)
     }))
 
     # Mock SpeechRecognitionService factory
-    sr_mock = MagicMock(name="SpeechRecognitionServiceMock")
+    sr_mock = SimpleNamespace()
     monkeypatch.setattr("src.core.app_factory.create_speech_recognition_service_prod", lambda *a, **k: sr_mock)
 
     # Mock LLMService factory
-    llm_mock = MagicMock(name="LLMServiceMock")
+    llm_mock = SimpleNamespace()
     monkeypatch.setattr("src.core.app_factory.LLMService", type("LLMServiceMockClass", (), {
         "create_with_ollama": staticmethod(lambda *args, **kwargs: llm_mock)
     }))
 
     # Mock ProjectAnalyzerService
-    pa_mock = MagicMock(name="ProjectAnalyzerServiceMock")
+    pa_mock = SimpleNamespace()
     monkeypatch.setattr("src.core.app_factory.ProjectAnalyzerService", lambda *args, **kwargs: pa_mock)
 
     # Mock SystemMonitor and PerformanceOptimizer
-    sm_mock = MagicMock(name="SystemMonitorMock")
-    po_mock = MagicMock(name="PerformanceOptimizerMock")
-    po_mock.start_monitoring = MagicMock()
+    sm_mock = SimpleNamespace()
+    po_mock = SimpleNamespace(start_monitoring=CallRecorder())
     monkeypatch.setattr("src.core.app_factory.SystemMonitor", lambda: sm_mock)
     monkeypatch.setattr("src.core.app_factory.PerformanceOptimizer", lambda: po_mock)
 
@@ -74,7 +87,6 @@ def mock_dependencies(monkeypatch):
 
 def test_create_assistant_happy_path(mock_dependencies):
     assistant = create_assistant()
-    from src.main import AssistantVocal
     assert isinstance(assistant, AssistantVocal)
 
     assert assistant.tts_service is mock_dependencies["tts"]
@@ -85,13 +97,12 @@ def test_create_assistant_happy_path(mock_dependencies):
     assert assistant.system_monitor is mock_dependencies["sm"]
     assert assistant.performance_optimizer is mock_dependencies["po"]
 
-    mock_dependencies["po"].start_monitoring.assert_called_once()
+    assert mock_dependencies["po"].start_monitoring.calls == 1
 
 
 def test_create_assistant_without_microphone(monkeypatch):
     # monkeypatch MicrophoneChecker to return False
-    mac_mock = MagicMock()
-    mac_mock.is_microphone_available.return_value = False
+    mac_mock = SimpleNamespace(is_microphone_available=lambda: False)
     monkeypatch.setattr("src.core.app_factory.MicrophoneChecker", lambda: mac_mock)
 
     # monkeypatch Settings to avoid error
@@ -2,68 +2,59 @@
 Tests unitaires pour le service de conversation
 """
 
-import pytest
-from src.services.conversation_service import ConversationService
 from unittest.mock import MagicMock
 
-class TestConversationService:
-    """Tests pour ConversationService"""
 
-    def test_get_last_message(self):
-        """Test de récupération du dernier message"""
-        service = ConversationService()
-        service.add_message("user", "Bonjour")
-        service.add_message("assistant", "Salut !")
+def test_get_last_message(fresh_conversation):
+    """Test de récupération du dernier message"""
+    service = fresh_conversation
+    service.add_message("user", "Bonjour")
+    service.add_message("assistant", "Salut !")
 
-        last_message = service.get_last_message()
-        assert last_message is not None
-        assert last_message["role"] == "assistant"
-        assert last_message["content"] == "Salut !"
+    last_message = service.get_last_message()
+    assert last_message is not None
+    assert (last_message["role"], last_message["content"]) == ("assistant", "Salut !")
 
-    def test_get_message_count(self):
-        """Test du compteur de messages"""
-        service = ConversationService()
-        assert service.get_message_count() == 0
+def test_get_message_count(fresh_conversation):
+    """Test du compteur de messages"""
+    service = fresh_conversation
+    assert service.get_message_count() == 0
 
-        service.add_message("user", "Bonjour")
-        assert service.get_message_count() == 1   
+    service.add_message("user", "Bonjour")
+    assert service.get_message_count() == 1
 
-    def test_generate_response(self):
-        """Test de génération de réponse"""
-        service = ConversationService()
-        mock_adapter = MagicMock()
-        mock_adapter.generate_response.return_value = "Réponse simulée"
+def test_generate_response(fresh_conversation):
+    """Test de génération de réponse"""
+    service = fresh_conversation
+    mock_adapter = MagicMock()
+    mock_adapter.generate_response.return_value = "Réponse simulée"
 
-        response = service.generate_response("Bonjour", mock_adapter)
-        assert response == "Réponse simulée"
-        assert service.get_message_count() == 2        
-    
-    def test_initialization(self):
-        """Test d'initialisation du service"""
-        service = ConversationService()
-        assert service is not None
-        assert len(service.get_history()) == 0
-    
-    def test_add_message(self):
-        """Test d'ajout de message"""
-        service = ConversationService()
-        service.add_message("user", "Bonjour")
-        
-        history = service.get_history()
-        assert len(history) == 1
-        assert history[0]["role"] == "user"
-        assert history[0]["content"] == "Bonjour"
-    
-    def test_clear_history(self):
-        """Test d'effacement de l'historique"""
-        service = ConversationService()
-        service.add_message("user", "Message 1")
-        service.add_message("assistant", "Réponse 1")
-        
-        assert len(service.get_history()) == 2
-        
-        service.clear_history()
-        assert len(service.get_history()) == 0
+    response = service.generate_response("Bonjour", mock_adapter)
+    assert response == "Réponse simulée"
+    assert service.get_message_count() == 2
 
-if __name__ == "__main__":
-    pytest.main([__file__])
+def test_initialization(fresh_conversation):
+    """Test d'initialisation du service"""
+    service = fresh_conversation
+    assert service is not None
+    assert len(service.get_history()) == 0
+
+def test_add_message(fresh_conversation):
+    """Test d'ajout de message"""
+    service = fresh_conversation
+    service.add_message("user", "Bonjour")
+
+    history = service.get_history()
+    assert [(m["role"], m["content"]) for m in history] == [("user", "Bonjour")]
+
+def test_clear_history(fresh_conversation):
+    """Test d'effacement de l'historique"""
+    service = fresh_conversation
+    service.add_message("user", "Message 1")
+    service.add_message("assistant", "Réponse 1")
+
+    history = service.get_history()
+    assert len(history) == 2
+
+    service.clear_history()
+    assert service.get_message_count() == 0
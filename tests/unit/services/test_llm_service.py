@@ -40,8 +40,7 @@ class TestLLMService:
 
     def test_get_available_models(self):
         models = self.llm_service.get_available_models()
-        assert isinstance(models, list)
-        assert len(models) > 0
+        assert isinstance(models, list) and len(models) > 0
 
     def test_create_with_simulation(self):
         service = LLMService.create_with_simulation()
@@ -95,8 +94,7 @@ class TestSimulatedLLMAdapter:
     def test_generate_recommendations(self):
         adapter = SimulatedLLMAdapter()
         recommendations = adapter.generate_recommendations("Test analysis")
-        assert isinstance(recommendations, list)
-        assert len(recommendations) > 0
+        assert isinstance(recommendations, list) and len(recommendations) > 0
 
 
 class TestOllamaLLMAdapter:
@@ -1,21 +1,25 @@
-from src.services.project_analyzer_service import SimulatedLLMAdapter, ProjectAnalyzerService
+def test_project_analyzer_service_basic(fs, analyzer):
+    # Setup: create a small project structure (système de fichiers en mémoire, pyfakefs)
+    fs.create_file("/proj/main.py", contents="print('hello')")
+    fs.create_file("/proj/README.md", contents="# Test project")
+    fs.create_file("/proj/requirements.txt", contents="requests\n")
 
-
-def test_project_analyzer_service_basic(tmp_path):
-    # Setup: create a small project structure
-    (tmp_path / "main.py").write_text("print('hello')")
-    (tmp_path / "README.md").write_text("# Test project")
-    (tmp_path / "requirements.txt").write_text("requests\n")
-
-    # Use simulated LLM adapter
-    llm_adapter = SimulatedLLMAdapter()
-    service = ProjectAnalyzerService(llm_adapter=llm_adapter)
-
-    report = service.analyze_project(str(tmp_path), depth=1)
+    report = analyzer.analyze_project("/proj", depth=1)
     # Basic sanity checks
-    assert report.get("project_name") == tmp_path.name
+    assert report.get("project_name") == "proj"
     assert report.get("ai_analysis") is not None
     assert "full_analysis" in report["ai_analysis"]
     assert isinstance(report["ai_analysis"]["full_analysis"], str)
     # Ensure some summary content
     assert "📊 Résumé" in report.get("summary", "")
+
+
+def test_export_report_lists_recommendations(analyzer):
+    report = {"project_name": "demo", "summary": "ok", "recommendations": ["Tester", "Documenter"]}
+
+    markdown = analyzer.export_report(report, "markdown")
+    text = analyzer.export_report(report, "text")
+
+    assert markdown.startswith("# 📊 Analyse: demo")
+    assert markdown.endswith("## 💡 Recommandations\n1. Tester\n2. Documenter\n")
+    assert text.endswith("RECOMMANDATIONS:\n  1. Tester\n  2. Documenter\n")
@@ -1,18 +1,20 @@
-import unittest
-from unittest.mock import MagicMock, patch
-import sys
-import os
+import pytest
 import numpy as np
 
-# Ajouter le chemin src pour les imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from src.services.speech_recognition_service import SpeechRecognitionService, ISpeechRecognitionAdapter
 
+# Tampon audio partagé, en lecture seule pour détecter toute mutation accidentelle
+_AUDIO_FIXTURE = np.array([1, 2, 3], dtype=np.int16)
+_AUDIO_FIXTURE.setflags(write=False)
+
 class MockSpeechRecognitionAdapter(ISpeechRecognitionAdapter):
     """Adaptateur mock pour les tests"""
     
     def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Remet les indicateurs d'appel à zéro"""
         self.transcribe_array_called = False
         self.transcribe_file_called = False
         self.unload_called = False
@@ -37,75 +39,84 @@ class MockSpeechRecognitionAdapter(ISpeechRecognitionAdapter):
     def get_available_models(self):
         return ["tiny", "base", "small"]
 
-class TestSpeechRecognitionService(unittest.TestCase):
-
-    def setUp(self):
-        """Initialisation avant chaque test"""
-        self.mock_adapter = MockSpeechRecognitionAdapter()
-        self.speech_recognition_service = SpeechRecognitionService(self.mock_adapter)
-
-    def test_initialization(self):
-        """Test d'initialisation du service"""
-        self.assertIsNotNone(self.speech_recognition_service.speech_recognition_adapter)
-        self.assertTrue(self.speech_recognition_service.is_available)
-
-    def test_transcribe(self):
-        """Test de transcription audio"""
-        audio_data = np.array([1, 2, 3], dtype=np.int16)
-        result = self.speech_recognition_service.transcribe(audio_data)
-        
-        self.assertEqual(result, "Test transcription")
-        self.assertTrue(self.mock_adapter.transcribe_array_called)
-
-    def test_transcribe_file(self):
-        """Test de transcription de fichier"""
-        result = self.speech_recognition_service.transcribe_file("test.wav")
-        
-        self.assertEqual(result, "Test file transcription")
-        self.assertTrue(self.mock_adapter.transcribe_file_called)
-
-    def test_unload_model(self):
-        """Test de déchargement du modèle"""
-        result = self.speech_recognition_service.unload_model()
-        
-        self.assertTrue(result)
-        self.assertTrue(self.mock_adapter.unload_called)
-
-    def test_optimize_model_cache(self):
-        """Test d'optimisation du cache"""
-        result = self.speech_recognition_service.optimize_model_cache()
-        
-        self.assertTrue(result)
-        self.assertTrue(self.mock_adapter.optimize_cache_called)
-
-    def test_get_available_models(self):
-        """Test de récupération des modèles disponibles"""
-        models = self.speech_recognition_service.get_available_models()
-        self.assertIsInstance(models, list)
-        self.assertIn("base", models)
-
-    def test_transcribe_with_exception(self):
-        """Test de transcription avec exception"""
-        self.mock_adapter.transcribe_array = MagicMock(side_effect=Exception("Transcription error"))
-        
-        audio_data = np.array([1, 2, 3], dtype=np.int16)
-        result = self.speech_recognition_service.transcribe(audio_data)
-        
-        self.assertEqual(result, "")
-
-    def test_transcribe_file_with_exception(self):
-        """Test de transcription de fichier avec exception"""
-        self.mock_adapter.transcribe_file = MagicMock(side_effect=Exception("File transcription error"))
-        
-        result = self.speech_recognition_service.transcribe_file("test.wav")
-        
-        self.assertEqual(result, "")
-
-    def test_test_transcription(self):
-        """Test de transcription de test"""
-        with patch('src.core.speech_recognition_service.logger'):
-            result = self.speech_recognition_service.test_transcription()
-            self.assertTrue(result)
-
-if __name__ == '__main__':
-    unittest.main()
+def _raise_transcribe(*args, **kwargs):
+    raise RuntimeError("Transcription error")
+
+def _raise_file(*args, **kwargs):
+    raise RuntimeError("File transcription error")
+
+@pytest.fixture(scope="module")
+def shared_adapter():
+    """Adaptateur mock instancié une seule fois pour le module"""
+    return MockSpeechRecognitionAdapter()
+
+@pytest.fixture(scope="module")
+def shared_service(shared_adapter):
+    """Service de reconnaissance vocale partagé par les tests du module"""
+    return SpeechRecognitionService(shared_adapter)
+
+@pytest.fixture
+def mock_adapter(shared_adapter):
+    """Adaptateur partagé, indicateurs d'appel remis à zéro avant chaque test"""
+    shared_adapter.reset()
+    return shared_adapter
+
+@pytest.fixture
+def speech_recognition_service(shared_service, mock_adapter):
+    """Service partagé, branché sur l'adaptateur remis à zéro"""
+    return shared_service
+
+def test_initialization(speech_recognition_service):
+    """Test d'initialisation du service"""
+    assert speech_recognition_service.speech_recognition_adapter is not None
+    assert speech_recognition_service.is_available
+
+@pytest.mark.parametrize("method, arg, expected, called_flag", [
+    ("transcribe", _AUDIO_FIXTURE, "Test transcription", "transcribe_array_called"),
+    ("transcribe_file", "test.wav", "Test file transcription", "transcribe_file_called"),
+], ids=["array", "file"])
+def test_transcribe_methods(speech_recognition_service, mock_adapter, method, arg, expected, called_flag):
+    """Test de transcription audio (tableau et fichier)"""
+    result = getattr(speech_recognition_service, method)(arg)
+
+    assert result == expected
+    assert getattr(mock_adapter, called_flag)
+
+def test_unload_model(speech_recognition_service, mock_adapter):
+    """Test de déchargement du modèle"""
+    result = speech_recognition_service.unload_model()
+
+    assert result
+    assert mock_adapter.unload_called
+
+def test_optimize_model_cache(speech_recognition_service, mock_adapter):
+    """Test d'optimisation du cache"""
+    result = speech_recognition_service.optimize_model_cache()
+
+    assert result
+    assert mock_adapter.optimize_cache_called
+
+def test_get_available_models(speech_recognition_service):
+    """Test de récupération des modèles disponibles"""
+    models = speech_recognition_service.get_available_models()
+    assert isinstance(models, list)
+    assert "base" in models
+
+@pytest.mark.parametrize("method, arg, adapter_method, raiser", [
+    ("transcribe", _AUDIO_FIXTURE, "transcribe_array", _raise_transcribe),
+    ("transcribe_file", "test.wav", "transcribe_file", _raise_file),
+], ids=["array", "file"])
+def test_transcribe_methods_with_exception(speech_recognition_service, mock_adapter, monkeypatch,
+                                           method, arg, adapter_method, raiser):
+    """Test de transcription avec exception : chaîne vide renvoyée"""
+    monkeypatch.setattr(mock_adapter, adapter_method, raiser)
+
+    assert getattr(speech_recognition_service, method)(arg) == ""
+
+def test_test_transcription(speech_recognition_service, caplog):
+    """Test de transcription de test"""
+    with caplog.at_level("INFO"):
+        result = speech_recognition_service.test_transcription()
+
+    assert result
+    assert "Test transcription réussi" in caplog.text
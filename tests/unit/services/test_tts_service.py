@@ -2,15 +2,11 @@
 Tests unitaires pour le service de synthèse vocale (TTS)
 """
 
-import unittest
+import pytest
 from unittest.mock import MagicMock, patch
-import sys
 import os
 
-# Ajouter le chemin src pour les imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from src.services.tts_service import TTSService, ITTSAdapter, PiperTTSAdapter
+from src.services.tts_service import TTSService, ITTSAdapter, PiperTTSAdapter, _scan_voices
 
 class MockTTSAdapter(ITTSAdapter):
     """Adaptateur mock pour les tests"""
@@ -33,131 +29,113 @@ class MockTTSAdapter(ITTSAdapter):
     def optimize_cache(self) -> bool:
         return True
 
-class TestTTSService(unittest.TestCase):
-    """Tests pour TTSService"""
-
-    def setUp(self):
-        """Initialisation avant chaque test"""
-        self.mock_adapter = MockTTSAdapter()
-        self.tts_service = TTSService(self.mock_adapter)
-
-    def test_initialization(self):
-        """Test d'initialisation du service TTS"""
-        self.assertIsNotNone(self.tts_service.tts_adapter)
-        self.assertTrue(self.tts_service.is_available)
-        self.assertIsInstance(self.tts_service, TTSService)
-
-    def test_speak_success(self):
-        """Test de synthèse vocale réussie"""
-        result = self.tts_service.speak("Bonjour")
-        
-        self.assertTrue(result)
-        self.assertTrue(self.mock_adapter.say_called)
+@pytest.fixture(scope="module")
+def tts_service():
+    """Service TTS construit une seule fois pour tout le module"""
+    return TTSService(MockTTSAdapter())
 
-    def test_speak_empty_text(self):
-        """Test de synthèse vocale avec texte vide"""
-        with patch('src.core.tts_service.logger') as mock_logger:
-            result = self.tts_service.speak("")
-            
-            self.assertFalse(result)
-            mock_logger.warning.assert_called_once()
+@pytest.fixture(autouse=True)
+def mock_adapter(tts_service):
+    """Adaptateur mock neuf et service disponible avant chaque test"""
+    adapter = MockTTSAdapter()
+    tts_service.tts_adapter = adapter
+    tts_service.is_available = True
+    return adapter
 
-    def test_speak_with_whitespace_only(self):
-        """Test de synthèse vocale avec espaces uniquement"""
-        with patch('src.core.tts_service.logger') as mock_logger:
-            result = self.tts_service.speak("   ")
-            
-            self.assertFalse(result)
-            mock_logger.warning.assert_called_once()
+class TestTTSService:
+    """Tests pour TTSService"""
 
-    def test_speak_unavailable_service(self):
-        """Test de synthèse vocale avec service indisponible"""
-        # Simuler un service indisponible
-        self.tts_service.is_available = False
+    def test_initialization(self, tts_service):
+        """Test d'initialisation du service TTS"""
+        assert tts_service.tts_adapter is not None
+        assert tts_service.is_available
+        assert isinstance(tts_service, TTSService)
+
+    @pytest.mark.parametrize("text, available, say_error, expected_log", [
+        ("Bonjour", True, None, None),
+        ("", True, None, ("WARNING", "Texte vide ou None, ignoré")),
+        ("   ", True, None, ("WARNING", "Texte vide ou None, ignoré")),
+        ("Bonjour", False, None, ("WARNING", "TTS non disponible, message ignoré")),
+        ("Bonjour", True, Exception("TTS Error"), ("ERROR", "Erreur speak: TTS Error")),
+    ], ids=["success", "empty_text", "whitespace_only", "unavailable", "exception"])
+    def test_speak(self, tts_service, mock_adapter, caplog, text, available, say_error, expected_log):
+        """Test de speak() : synthèse, garde-fous et erreurs de l'adaptateur"""
+        tts_service.is_available = available
+        if say_error is not None:
+            mock_adapter.say = MagicMock(side_effect=say_error)
         
-        with patch('src.core.tts_service.logger') as mock_logger:
-            result = self.tts_service.speak("Bonjour")
-            
-            self.assertFalse(result)
-            mock_logger.warning.assert_called_once_with("TTS non disponible, message ignoré")
-
-    def test_speak_with_exception(self):
-        """Test de synthèse vocale avec exception"""
-        self.mock_adapter.say = MagicMock(side_effect=Exception("TTS Error"))
+        with caplog.at_level("WARNING"):
+            result = tts_service.speak(text)
         
-        with patch('src.core.tts_service.logger') as mock_logger:
-            result = self.tts_service.speak("Bonjour")
-            
-            self.assertFalse(result)
-            mock_logger.error.assert_called_once()
-
-    def test_test_synthesis_success(self):
+        assert result is (expected_log is None)
+        assert mock_adapter.say_called is (expected_log is None)
+        if expected_log is None:
+            assert not caplog.records
+        else:
+            assert [(r.levelname, r.getMessage()) for r in caplog.records] == [expected_log]
+
+    def test_test_synthesis_success(self, tts_service, caplog):
         """Test de synthèse de test réussie"""
-        with patch('src.core.tts_service.logger') as mock_logger:
-            result = self.tts_service.test_synthesis()
-            
-            self.assertTrue(result)
-            mock_logger.info.assert_called_with("✅ Test TTS réussi")
+        with caplog.at_level("INFO"):
+            result = tts_service.test_synthesis()
+        
+        assert result
+        assert caplog.records[-1].getMessage() == "✅ Test TTS réussi"
 
-    def test_test_synthesis_failure(self):
+    def test_test_synthesis_failure(self, tts_service, mock_adapter, caplog):
         """Test de synthèse de test échouée"""
-        self.mock_adapter.say = MagicMock(return_value=False)
-        # Recréer le service avec l'adaptateur modifié
-        self.tts_service = TTSService(self.mock_adapter)
+        mock_adapter.say = MagicMock(return_value=False)
         
-        with patch('src.core.tts_service.logger') as mock_logger:
-            result = self.tts_service.test_synthesis()
-            
-            self.assertFalse(result)
-            mock_logger.error.assert_called_once_with("❌ Test TTS échoué")
+        result = tts_service.test_synthesis()
+        
+        assert not result
+        assert [(r.levelname, r.getMessage()) for r in caplog.records] == [("ERROR", "❌ Test TTS échoué")]
 
-    def test_test_synthesis_with_custom_text(self):
+    def test_test_synthesis_with_custom_text(self, tts_service, mock_adapter):
         """Test de synthèse de test avec texte personnalisé"""
         test_text = "Test personnalisé"
         
-        result = self.tts_service.test_synthesis(test_text)
+        result = tts_service.test_synthesis(test_text)
         
-        self.assertTrue(result)
-        self.assertTrue(self.mock_adapter.say_called)
+        assert result
+        assert mock_adapter.say_called
 
-    def test_get_available_voices_success(self):
+    def test_get_available_voices_success(self, tts_service):
         """Test de récupération des voix disponibles"""
-        voices = self.tts_service.get_available_voices()
+        voices = tts_service.get_available_voices()
         
-        self.assertEqual(voices, ["test-voice"])
+        assert voices == ["test-voice"]
 
-    def test_get_available_voices_with_exception(self):
+    def test_get_available_voices_with_exception(self, tts_service, mock_adapter, caplog):
         """Test de récupération des voix avec exception"""
-        self.mock_adapter.get_available_voices = MagicMock(side_effect=Exception("Voice error"))
+        mock_adapter.get_available_voices = MagicMock(side_effect=Exception("Voice error"))
         
-        with patch('src.core.tts_service.logger') as mock_logger:
-            voices = self.tts_service.get_available_voices()
-            
-            self.assertEqual(voices, ["fr_FR-siwis-medium"])
-            mock_logger.error.assert_called_once()
+        voices = tts_service.get_available_voices()
+        
+        assert voices == ["fr_FR-siwis-medium"]
+        assert [r.levelname for r in caplog.records] == ["ERROR"]
 
-    def test_unload_voice_success(self):
+    def test_unload_voice_success(self, tts_service, mock_adapter):
         """Test de déchargement de voix réussi"""
-        result = self.tts_service.unload_voice()
+        result = tts_service.unload_voice()
         
-        self.assertTrue(result)
-        self.assertTrue(self.mock_adapter.unload_voice_called)
+        assert result
+        assert mock_adapter.unload_voice_called
 
-    def test_unload_voice_with_exception(self):
+    def test_unload_voice_with_exception(self, tts_service, mock_adapter, caplog):
         """Test de déchargement de voix avec exception"""
-        self.mock_adapter.unload_voice = MagicMock(side_effect=Exception("Unload error"))
+        mock_adapter.unload_voice = MagicMock(side_effect=Exception("Unload error"))
         
-        with patch('src.core.tts_service.logger') as mock_logger:
-            result = self.tts_service.unload_voice()
-            
-            self.assertFalse(result)
-            mock_logger.error.assert_called_once()
+        result = tts_service.unload_voice()
+        
+        assert not result
+        assert [r.levelname for r in caplog.records] == ["ERROR"]
 
-    def test_optimize_voice_cache_success(self):
+    def test_optimize_voice_cache_success(self, tts_service):
         """Test d'optimisation du cache voix"""
-        result = self.tts_service.optimize_voice_cache()
+        result = tts_service.optimize_voice_cache()
         
-        self.assertTrue(result)
+        assert result
 
     def test_optimize_voice_cache_with_exception(self):
         """Test d'optimisation du cache voix avec exception"""
@@ -167,10 +145,9 @@ class TestTTSService(unittest.TestCase):
         
         service = TTSService(mock_adapter_no_cache)
         
-        with patch('src.core.tts_service.logger') as mock_logger:
-            result = service.optimize_voice_cache()
-            
-            self.assertTrue(result)
+        result = service.optimize_voice_cache()
+        
+        assert result
 
     def test_create_with_piper(self):
         """Test de la factory method create_with_piper"""
@@ -180,8 +157,41 @@ class TestTTSService(unittest.TestCase):
             
             service = TTSService.create_with_piper("test-voice")
             
-            self.assertIsInstance(service, TTSService)
+            assert isinstance(service, TTSService)
             mock_piper.assert_called_once_with("test-voice")
 
-if __name__ == '__main__':
-    unittest.main()
+class TestPiperTTSAdapterVoices:
+    """Tests du listing des voix de PiperTTSAdapter"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_scan_cache(self):
+        _scan_voices.cache_clear()
+        yield
+        _scan_voices.cache_clear()
+
+    def test_get_available_voices_cached(self, tmp_path):
+        """Le dossier n'est relu que si son mtime change"""
+        (tmp_path / "voice1").mkdir()
+        (tmp_path / "voice2").mkdir()
+        adapter = PiperTTSAdapter.__new__(PiperTTSAdapter)
+        
+        with patch('src.services.tts_service.config') as mock_config, \
+             patch('src.services.tts_service.os.listdir', wraps=os.listdir) as mock_listdir:
+            mock_config.VOICES_FOLDER = str(tmp_path)
+            first = adapter.get_available_voices()
+            second = adapter.get_available_voices()
+        
+        assert sorted(first) == ["voice1", "voice2"]
+        assert second == first
+        mock_listdir.assert_called_once()
+
+    def test_get_available_voices_exception_not_cached(self, tmp_path):
+        """Un échec de listing ne reste pas en cache"""
+        (tmp_path / "voice1").mkdir()
+        adapter = PiperTTSAdapter.__new__(PiperTTSAdapter)
+        
+        with patch('src.services.tts_service.config') as mock_config:
+            mock_config.VOICES_FOLDER = str(tmp_path)
+            with patch('src.services.tts_service.os.listdir', side_effect=OSError("Erreur")):
+                assert adapter.get_available_voices() == ["fr_FR-siwis-medium"]
+            assert adapter.get_available_voices() == ["voice1"]
@@ -68,8 +68,7 @@ class TestWhisperSpeechRecognition:
     def test_get_available_models_returns_list(self, whisper_adapter):
         """Test liste modèles disponibles."""
         models = whisper_adapter.get_available_models()
-        assert isinstance(models, list)
-        assert len(models) > 0
+        assert isinstance(models, list) and len(models) > 0
         assert "tiny" in models
         assert "base" in models
         assert "small" in models
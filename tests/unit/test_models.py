@@ -1,9 +1,36 @@
 """
 Tests complets pour les modèles de données
 """
+import asyncio
+import io
+import subprocess
+import wave
+import numpy as np
 import pytest
+from collections import OrderedDict
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+_arr = np.array
+_i16 = np.int16
+
+# Échantillon audio partagé, en lecture seule pour détecter toute mutation
+_SAMPLE_AUDIO = _arr([1000, 2000, 3000], dtype=_i16)
+_SAMPLE_AUDIO.setflags(write=False)
+
+
+def _build_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """Construit un fichier WAV mono 16 bits en mémoire."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+_WAV_BYTES = _build_wav(_SAMPLE_AUDIO, 22050)
 
 
 class TestOllamaClient:
@@ -247,23 +274,311 @@ class TestDataFileAnalyzer:
 class TestTextToSpeech:
     """Tests complets pour TTS."""
     
-    def test_text_to_speech_import(self):
+    @pytest.fixture(scope="class")
+    def tts(self):
+        """Instance TTS partagée par la classe (un seul essai d'import Piper)."""
+        from src.models.text_to_speech import TextToSpeech
+        
+        return TextToSpeech()
+    
+    @pytest.fixture(autouse=True)
+    def _reset(self, tts):
+        """Réinitialise l'état mutable de l'instance partagée."""
+        tts.audio_cache.clear()
+        tts.current_voice = None
+        tts.use_python_lib = tts.PiperVoice is not None
+        yield
+    
+    def test_text_to_speech_import(self, tts):
         """Test d'import TTS."""
+        assert tts is not None
+    
+    def test_get_speakers(self, tts):
+        """Test de récupération de speakers."""
+        speakers = tts.get_speakers()
+        
+        assert speakers is not None
+    
+    def test_piper_import_success(self, monkeypatch):
+        """Test avec la bibliothèque Piper disponible."""
         from src.models.text_to_speech import TextToSpeech
         
+        fake_piper = Mock()
+        monkeypatch.setattr(TextToSpeech, "_probe_piper", staticmethod(lambda: fake_piper))
+        
         tts = TextToSpeech()
         
-        assert tts is not None
+        assert tts.use_python_lib is True
+        assert tts.PiperVoice is fake_piper.PiperVoice
     
-    def test_get_speakers(self):
-        """Test de récupération de speakers."""
+    def test_piper_import_failure(self, monkeypatch):
+        """Test du fallback CLI sans bibliothèque Piper."""
         from src.models.text_to_speech import TextToSpeech
         
+        monkeypatch.setattr(TextToSpeech, "_probe_piper", staticmethod(lambda: None))
+        
         tts = TextToSpeech()
         
-        speakers = tts.get_speakers()
+        assert tts.use_python_lib is False
+        assert tts.PiperVoice is None
+    
+    def test_probe_piper_imports_module(self, stub_module):
+        """Test de la sonde Piper (hors cache) : module présent puis absent."""
+        from src.models.text_to_speech import TextToSpeech
+        probe = TextToSpeech._probe_piper.__wrapped__
         
-        assert speakers is not None
+        fake_piper = stub_module("piper")
+        assert probe() is fake_piper
+        
+        stub_module("piper", None)
+        assert probe() is None
+    
+    @pytest.mark.parametrize("voice_type, text, cached, expected_path, expected", [
+        ("cli", "test", False, "_synthesize_cli", "synth"),
+        ("py", "test", False, "_synthesize_python_simple", "synth"),
+        (None, "test", False, None, None),
+        ("cli", "", False, None, None),
+        ("cli", "test", True, None, "cached"),
+    ], ids=["cli", "python", "no_voice", "empty_text", "cache_hit"])
+    def test_synthesize_dispatch(self, tts, voice_type, text, cached, expected_path, expected):
+        """Test du routage de synthesize() : moteur, garde-fous et cache."""
+        if voice_type is not None:
+            tts.current_voice = {"type": voice_type, "voice_name": "test", "model_path": "test.onnx"}
+        tts.use_python_lib = voice_type == "py"
+        if cached:
+            tts.audio_cache[tts._cache_key(text, 1.0)] = _SAMPLE_AUDIO
+        fresh = _arr([7, 8, 9], dtype=_i16)
+        
+        with patch.object(tts, "_synthesize_cli", return_value=fresh) as mock_cli, \
+             patch.object(tts, "_synthesize_python_simple", return_value=fresh) as mock_py, \
+             patch.object(tts, "load_voice", return_value=False):
+            result = tts.synthesize(text)
+        
+        engines = {"_synthesize_cli": mock_cli, "_synthesize_python_simple": mock_py}
+        for name, engine in engines.items():
+            assert engine.call_count == (1 if name == expected_path else 0)
+        
+        if expected == "synth":
+            assert result is fresh
+        elif expected == "cached":
+            assert result is _SAMPLE_AUDIO
+        else:
+            assert result is None
+    
+    def test_cache_key_depends_on_speed_and_voice(self, tts):
+        """Test que la clé de cache distingue vitesse et voix."""
+        tts.current_voice = {"voice_name": "voice1"}
+        key = tts._cache_key("Bonjour", 1.0)
+        
+        assert key == tts._cache_key("Bonjour", 1.0)
+        assert key != tts._cache_key("Bonjour", 1.5)
+        
+        tts.current_voice = {"voice_name": "voice2"}
+        assert key != tts._cache_key("Bonjour", 1.0)
+    
+    def test_synthesize_caches_read_only_audio(self, tts):
+        """Test que l'audio mis en cache ne peut pas être modifié par l'appelant."""
+        tts.current_voice = {"type": "cli", "voice_name": "test", "model_path": "test.onnx"}
+        tts.use_python_lib = False
+        
+        with patch.object(tts, "_synthesize_cli", return_value=_arr([7, 8, 9], dtype=_i16)):
+            result = tts.synthesize("test")
+        
+        assert tts.audio_cache[("test", 1.0, "test")] is result
+        with pytest.raises(ValueError):
+            result[0] = 0
+    
+    def test_optimize_cache_evicts_least_recently_used(self, tts):
+        """Test de l'éviction LRU du cache audio."""
+        tts.audio_cache.update(OrderedDict.fromkeys(range(60), _SAMPLE_AUDIO))
+        tts.audio_cache.move_to_end(0)
+        
+        evicted = tts.optimize_cache(target_size=50)
+        
+        assert evicted == 10
+        assert len(tts.audio_cache) == 50
+        assert 0 in tts.audio_cache
+        assert 1 not in tts.audio_cache
+    
+    def test_synthesize_batch_caches_per_entry(self, tts):
+        """Test que seuls les textes absents du cache partent en un appel groupé."""
+        tts.current_voice = {"type": "cli", "voice_name": "test", "model_path": "test.onnx"}
+        tts.audio_cache[tts._cache_key("un", 1.0)] = _SAMPLE_AUDIO
+        fresh = _arr([7, 8, 9], dtype=_i16)
+        
+        with patch.object(tts, "_synthesize_cli_batch", return_value=[fresh, fresh]) as mock_batch:
+            results = tts.synthesize_batch(["un", "deux", "trois"])
+        
+        assert mock_batch.call_count == 1
+        assert mock_batch.call_args[0][0] == ["deux", "trois"]
+        assert results[0] is _SAMPLE_AUDIO
+        assert results[1] is fresh and results[2] is fresh
+        assert tts._cache_key("deux", 1.0) in tts.audio_cache
+    
+    def test_synthesize_cli_batch_timeout_kills_process(self, tts):
+        """Test du timeout de la CLI par lot : Piper est tué et le délai est plafonné."""
+        tts.current_voice = {"type": "cli", "voice_name": "test", "model_path": "test.onnx"}
+        process = Mock()
+        process.communicate.side_effect = [subprocess.TimeoutExpired("piper", 120), ("", "")]
+        
+        with patch("src.models.text_to_speech.subprocess.Popen", return_value=process):
+            results = tts._synthesize_cli_batch(["texte"] * 10, 1.0)
+        
+        assert results == [None] * 10
+        assert process.communicate.call_args_list[0].kwargs["timeout"] == 120
+        process.kill.assert_called_once()
+    
+    def _stream_process(self, audio, returncode):
+        process = Mock()
+        process.stdout = io.BytesIO(audio.tobytes())
+        process.wait.return_value = returncode
+        process.poll.return_value = returncode
+        return process
+    
+    def test_synthesize_stream_yields_chunks_in_order(self, tts):
+        """Test que le flux CLI produit, dans l'ordre, des blocs reconstituant l'audio."""
+        tts.current_voice = {"type": "cli", "voice_name": "test", "model_path": "test.onnx",
+                             "sample_rate": 22050}
+        audio = np.arange(2000, dtype=_i16)
+        process = self._stream_process(audio, 0)
+        
+        with patch("src.models.text_to_speech.subprocess.Popen", return_value=process) as mock_popen:
+            chunks = list(tts.synthesize_stream("test"))
+        
+        assert len(chunks) > 1
+        assert "--output-raw" in mock_popen.call_args[0][0]
+        np.testing.assert_array_equal(np.concatenate(chunks), audio)
+        process.stdin.write.assert_called_once_with("test".encode("utf-8"))
+        process.kill.assert_not_called()
+    
+    def test_synthesize_stream_raises_on_piper_failure(self, tts):
+        """Test qu'un code de sortie non nul de Piper lève une erreur après le dernier bloc."""
+        tts.current_voice = {"type": "cli", "voice_name": "test", "model_path": "test.onnx",
+                             "sample_rate": 22050}
+        audio = np.arange(2000, dtype=_i16)
+        process = self._stream_process(audio, 1)
+        
+        with patch("src.models.text_to_speech.subprocess.Popen", return_value=process):
+            stream = tts.synthesize_stream("test")
+            chunks = [next(stream)]
+            with pytest.raises(RuntimeError, match="code 1"):
+                chunks.extend(stream)
+        
+        assert len(chunks) > 1
+        process.wait.assert_called_once_with(timeout=30)
+    
+    def test_synthesize_stream_applies_speed_on_python_backend(self, tts):
+        """Test que la vitesse est appliquée à chaque bloc de la bibliothèque Piper."""
+        chunk = Mock(audio_float_array=np.zeros(100, dtype=np.float32))
+        voice = Mock()
+        voice.synthesize.return_value = [chunk, chunk]
+        tts.use_python_lib = True
+        tts.current_voice = {"type": "py", "voice": voice, "sample_rate": 22050}
+        
+        with patch.object(tts, "_adjust_speed", side_effect=lambda audio, speed, rate: audio[:50]) as mock_adjust:
+            chunks = list(tts.synthesize_stream("test", speed=2.0))
+        
+        assert [len(c) for c in chunks] == [50, 50]
+        assert mock_adjust.call_count == 2
+        assert mock_adjust.call_args[0][1:] == (2.0, 22050)
+    
+    def test_synthesize_cli_success(self, tts):
+        """Test de la synthèse CLI : PCM lu sur stdout, aucun fichier temporaire."""
+        tts.current_voice = {"type": "cli", "voice_name": "test", "model_path": "test.onnx"}
+        process = Mock(returncode=0)
+        process.communicate.return_value = (_SAMPLE_AUDIO.tobytes(), b"")
+        
+        with patch("src.models.text_to_speech.subprocess.Popen", return_value=process) as mock_popen, \
+             patch("src.models.text_to_speech.os.path.exists") as mock_exists:
+            result = tts._synthesize_cli("test", 1.0)
+        
+        np.testing.assert_array_equal(result, _SAMPLE_AUDIO)
+        assert "--output-raw" in mock_popen.call_args[0][0]
+        process.communicate.assert_called_once_with(input=b"test", timeout=30)
+        mock_exists.assert_not_called()
+    
+    def test_read_wav_from_buffer(self, tts):
+        """Test du décodage WAV depuis un tampon mémoire."""
+        np.testing.assert_array_equal(tts._read_wav(io.BytesIO(_WAV_BYTES)), _SAMPLE_AUDIO)
+    
+    def test_synthesize_cli_async_timeout(self, tts):
+        """Test du timeout de la synthèse CLI asynchrone : le processus est tué."""
+        tts.current_voice = {"type": "cli", "voice_name": "test", "model_path": "test.onnx"}
+        process = Mock()
+        
+        async def never_finishes(_input):
+            await asyncio.sleep(10)
+        
+        process.communicate = never_finishes
+        process.wait = AsyncMock()
+        
+        with patch("src.models.text_to_speech.asyncio.create_subprocess_exec",
+                   AsyncMock(return_value=process)) as mock_exec:
+            result = asyncio.run(tts._synthesize_cli_async("test", 1.0, timeout=0.01))
+        
+        assert result is None
+        assert mock_exec.call_args[0][0] == "piper"
+        process.kill.assert_called_once()
+    
+    def test_adjust_speed_unchanged(self, tts):
+        """Test que la vitesse nominale renvoie le buffer tel quel."""
+        assert tts._adjust_speed(_SAMPLE_AUDIO, 1.0, 22050) is _SAMPLE_AUDIO
+    
+    def test_adjust_speed_prefers_time_stretch(self, tts, stub_module):
+        """Test que librosa.time_stretch (hauteur conservée) passe avant le rééchantillonnage."""
+        librosa = stub_module("librosa")
+        librosa.effects.time_stretch.return_value = np.zeros(10, dtype=np.float32)
+        
+        result = tts._adjust_speed(np.arange(15, dtype=_i16), 1.5, 22050)
+        
+        assert librosa.effects.time_stretch.call_args.kwargs == {"rate": 1.5}
+        assert result.dtype == _i16 and len(result) == 10
+    
+    def test_adjust_speed_scipy_resample(self, tts, stub_module):
+        """Test du repli scipy sans librosa : durée divisée par la vitesse."""
+        pytest.importorskip("scipy")
+        stub_module("librosa", None)
+        t = np.arange(22050) / 22050
+        audio = (np.sin(2 * np.pi * 440 * t) * 10000).astype(_i16)
+        
+        result = tts._adjust_speed(audio, 1.5, 22050)
+        
+        assert result.dtype == _i16
+        assert len(result) == round(len(audio) / 1.5)
+    
+    def test_adjust_speed_without_scipy_or_librosa(self, tts, stub_module):
+        """Test du repli linéaire quand ni scipy ni librosa ne sont importables."""
+        audio = np.arange(2000, dtype=_i16)
+        stub_module("scipy", None)
+        stub_module("librosa", None)
+        
+        result = tts._adjust_speed(audio, 1.5, 22050)
+        
+        assert result.dtype == _i16
+        assert len(result) == int(round(len(audio) / 1.5))
+        np.testing.assert_array_equal(result[:3], [0, 1, 3])
+    
+    def test_pcm16_conversion_matches_legacy(self):
+        """Test de non-régression : conversions fusionnées identiques bit à bit."""
+        from src.models.text_to_speech import _float_to_pcm16, _pcm16_to_float
+        t = np.arange(22050) / 22050
+        audio = (np.sin(2 * np.pi * 440 * t) * 32767).astype(_i16)
+        
+        audio_float = _pcm16_to_float(audio)
+        legacy_float = audio.astype(np.float32) / 32768.0
+        
+        assert audio_float.dtype == np.float32
+        np.testing.assert_array_equal(audio_float, legacy_float)
+        np.testing.assert_array_equal(_float_to_pcm16(audio_float.copy()),
+                                      (legacy_float * 32768.0).astype(_i16))
+    
+    def test_cleanup(self, tts):
+        """Test du nettoyage du cache audio."""
+        tts.audio_cache["key"] = _SAMPLE_AUDIO
+        
+        tts.cleanup()
+        
+        assert tts.audio_cache == {}
 
 
 class TestAudioDeviceManager:
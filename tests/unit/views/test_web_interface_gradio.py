@@ -1,110 +1,175 @@
-import unittest
-from unittest.mock import MagicMock, patch
-import sys
-import os
+import types
+import pytest
+from unittest.mock import MagicMock, create_autospec, patch
 
-# Ajouter le chemin src pour les imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Un seul worker xdist exécute ce module : l'interface n'est construite qu'une fois
+pytestmark = pytest.mark.xdist_group("gradio")
 
-from src.views.web_interface_gradio import GradioWebInterface
+# Valeurs attendues partagées par les tests
+_VOICES = ("voice1", "voice2")
+_MODELS = ("model1", "model2")
+_DEFAULT_VOICE = "fr_FR-siwis-medium"
+_DEFAULT_MODEL = "qwen3-coder:latest"
 
-class TestWebInterfaceGradio(unittest.TestCase):
 
-    def setUp(self):
-        """Initialisation avant chaque test"""
-        self.mock_assistant = MagicMock()
-        self.interface = GradioWebInterface(self.mock_assistant)
+@pytest.fixture(scope="session")
+def gradio_interface_cls():
+    """Classe de l'interface, importée au premier test qui la demande.
 
-    def test_initialization(self):
+    La collecte du fichier ne paie pas l'import de gradio quand la suite est
+    filtrée; sans gradio (ou pyaudio pour le contrôleur audio), les tests sont ignorés.
+    """
+    pytest.importorskip("gradio")
+    return pytest.importorskip("src.views.web_interface_gradio").GradioWebInterface
+
+
+@pytest.fixture(scope="session")
+def assistant_cls():
+    """Classe AssistantVocal, importée à la demande (tests ignorés sans pyaudio)."""
+    return pytest.importorskip("src.main").AssistantVocal
+
+
+@pytest.fixture(scope="module")
+def interface(gradio_interface_cls, assistant_cls):
+    """Interface construite une seule fois (import et graphe Gradio coûteux)."""
+    return gradio_interface_cls(create_autospec(assistant_cls, instance=True))
+
+
+@pytest.fixture
+def mock_assistant_controller(interface, assistant_cls):
+    """Contrôleur neuf pour chaque test, rebranché sur l'interface partagée.
+
+    L'autospec d'AssistantVocal refuse les méthodes qui n'existent pas; les
+    services (attributs d'instance) sont branchés explicitement par les tests.
+    """
+    controller = create_autospec(assistant_cls, instance=True)
+    interface.assistant = controller
+    return controller
+
+
+@pytest.fixture(autouse=True)
+def _reset_interface(interface, mock_assistant_controller):
+    """Remet à zéro l'état muté par les tests."""
+    yield
+    interface.demo = None
+    interface.chat_history.clear()
+
+
+def _stub(**attrs):
+    """Porteur d'attributs minimal, bien moins coûteux à construire qu'un MagicMock."""
+    return types.SimpleNamespace(**attrs)
+
+
+def _returning(value=None, error=None):
+    """Fonction qui renvoie ``value``, ou lève ``error`` s'il est fourni."""
+    def _call(*args, **kwargs):
+        if error is not None:
+            raise error
+        return value
+    return _call
+
+
+def _set_voices(controller, voices=None, error=None):
+    """Branche un tts_service minimal sur le contrôleur."""
+    controller.tts_service = _stub(get_available_voices=_returning(voices, error))
+
+
+def _set_models(controller, models=None, error=None):
+    """Branche un llm_service minimal sur le contrôleur."""
+    controller.llm_service = _stub(get_available_models=_returning(models, error))
+
+
+class TestWebInterfaceGradio:
+
+    def test_initialization(self, interface):
         """Test d'initialisation de l'interface"""
-        self.assertIsNotNone(self.interface.assistant)
-        self.assertIsNone(self.interface.demo)
+        assert interface.assistant is not None
+        assert interface.demo is None
 
     # Tests pour les méthodes de gestion audio
-    def test_get_microphone_choices(self):
+    def test_get_microphone_choices(self, interface):
         """Test de récupération des microphones"""
         # Configurer le mock
-        with patch.object(self.interface.audio_controller, 'get_microphones', return_value=["0: Microphone 1", "1: Microphone 2"]):
-            choices = self.interface._get_microphone_choices()
-            self.assertIsInstance(choices, list)
+        with patch.object(interface.audio_controller, 'get_microphones', return_value=["0: Microphone 1", "1: Microphone 2"]):
+            choices = interface._get_microphone_choices()
+            assert isinstance(choices, list)
 
-    def test_get_microphone_choices_error(self):
+    def test_get_microphone_choices_error(self, interface):
         """Test de récupération des microphones avec erreur"""
-        # Configurer le mock pour lever une exception
-        with patch.object(self.interface.audio_controller, 'get_microphones', side_effect=Exception("Erreur")):
-            # L'exception doit être gérée par la méthode, donc on s'attend à avoir une valeur de retour par défaut
-            try:
-                choices = self.interface._get_microphone_choices()
-                # Si l'exception est correctement gérée, on doit avoir une liste de retour
-                self.assertIsInstance(choices, list)
-            except Exception:
-                # Si l'exception n'est pas gérée, le test échoue
-                self.fail("L'exception n'a pas été gérée correctement")
-
-    def test_get_default_microphone(self):
+        # L'exception doit être gérée par la méthode, qui renvoie une liste par défaut
+        with patch.object(interface.audio_controller, 'get_microphones', side_effect=Exception("Erreur")):
+            choices = interface._get_microphone_choices()
+            assert isinstance(choices, list)
+
+    def test_get_default_microphone(self, interface):
         """Test de récupération du microphone par défaut"""
-        with patch.object(self.interface.audio_controller, 'get_default_microphone', return_value="0: Microphone 1"):
-            default_mic = self.interface._get_default_microphone()
-            self.assertIsInstance(default_mic, str)
+        with patch.object(interface.audio_controller, 'get_default_microphone', return_value="0: Microphone 1"):
+            default_mic = interface._get_default_microphone()
+            assert isinstance(default_mic, str)
 
     # Tests pour les méthodes de gestion des voix
-    def test_get_voice_choices(self):
+    def test_get_voice_choices(self, interface, mock_assistant_controller):
         """Test de récupération des voix"""
-        # Configurer le mock
-        self.mock_assistant.tts_service = MagicMock()
-        self.mock_assistant.tts_service.get_available_voices.return_value = ["voice1", "voice2"]
+        _set_voices(mock_assistant_controller, list(_VOICES))
 
-        choices = self.interface._get_voice_choices()
-        self.assertEqual(choices, ["voice1", "voice2"])
+        choices = interface._get_voice_choices()
+        assert choices == list(_VOICES)
 
-    def test_get_voice_choices_error(self):
+    def test_get_voice_choices_error(self, interface, mock_assistant_controller):
         """Test de récupération des voix avec erreur"""
-        # Configurer le mock pour lever une exception
-        self.mock_assistant.tts_service = MagicMock()
-        self.mock_assistant.tts_service.get_available_voices.side_effect = Exception("Erreur")
+        _set_voices(mock_assistant_controller, error=Exception("Erreur"))
 
-        choices = self.interface._get_voice_choices()
-        self.assertEqual(choices, ["fr_FR-siwis-medium"])
+        choices = interface._get_voice_choices()
+        assert choices == [_DEFAULT_VOICE]
 
-    def test_get_default_voice(self):
-        """Test de récupération de la voix par défaut"""
-        default_voice = self.interface._get_default_voice()
-        self.assertEqual(default_voice, "fr_FR-siwis-medium")
+    @pytest.mark.parametrize("getter, expected", [
+        ("_get_default_voice", _DEFAULT_VOICE),
+        ("_get_default_model", _DEFAULT_MODEL),
+    ])
+    def test_get_default(self, interface, getter, expected):
+        """Test des valeurs par défaut (voix, modèle)"""
+        assert getattr(interface, getter)() == expected
 
     # Tests pour les méthodes de gestion des modèles
-    def test_get_model_choices(self):
+    def test_get_model_choices(self, interface, mock_assistant_controller):
         """Test de récupération des modèles"""
-        # Configurer le mock
-        self.mock_assistant.llm_service = MagicMock()
-        self.mock_assistant.llm_service.get_available_models.return_value = ["model1", "model2"]
+        _set_models(mock_assistant_controller, list(_MODELS))
 
-        choices = self.interface._get_model_choices()
-        self.assertIsInstance(choices, list)
+        choices = interface._get_model_choices()
+        assert choices == list(_MODELS)
 
-    def test_get_default_model(self):
-        """Test de récupération du modèle par défaut"""
-        default_model = self.interface._get_default_model()
-        self.assertEqual(default_model, "qwen3-coder:latest")
+    # Tests pour les statistiques système
+    @pytest.mark.parametrize("stats, error, present, absent", [
+        ({"cpu_percent": 25.5, "memory_percent": 60.3, "gpu_memory_used": 1024},
+         None, ["CPU: 25.5%", "Mémoire: 60.3%", "GPU: 1024MB"], []),
+        ({"cpu_percent": 25.5, "memory_percent": 60.3}, None, ["CPU: 25.5%"], ["GPU:"]),
+        ({}, None, ["❌ Stats non disponibles"], ["CPU:"]),
+        (None, Exception("Erreur"), ["❌ Erreur stats"], ["CPU:"]),
+    ], ids=["with_gpu", "without_gpu", "empty", "error"])
+    def test_get_system_stats_text(self, interface, mock_assistant_controller, stats, error, present, absent):
+        """Test du formatage des statistiques système"""
+        mock_assistant_controller.system_monitor = _stub(get_system_stats=_returning(stats, error))
+
+        text = interface._get_system_stats_text()
+
+        assert all(fragment in text for fragment in present)
+        assert not any(fragment in text for fragment in absent)
 
     # Tests pour les méthodes de gestion des prompts
-    def test_get_saved_prompts(self):
+    def test_get_saved_prompts(self, interface):
         """Test de récupération des prompts sauvegardés"""
-        prompts = self.interface._get_saved_prompts()
-        self.assertIsInstance(prompts, list)
-        self.assertGreater(len(prompts), 0)
+        prompts = interface._get_saved_prompts()
+        assert isinstance(prompts, list) and len(prompts) > 0
 
-    @patch('src.views.web_interface_gradio.gr')
-    def test_launch(self, mock_gr):
+    def test_launch(self, interface):
         """Test du lancement de l'interface"""
         # Configurer les mocks
         mock_demo = MagicMock()
-        self.interface.demo = mock_demo
+        interface.demo = mock_demo
 
         # Appeler la méthode
-        self.interface.launch(server_port=7860)
+        with patch('src.views.web_interface_gradio.gr'):
+            interface.launch(server_port=7860)
 
         # Vérifier que launch a été appelé (les paramètres exacts peuvent varier)
         mock_demo.launch.assert_called()
-
-if __name__ == '__main__':
-    unittest.main()